@@ -1,7 +1,8 @@
-from .start import GlassBatchRunner, TimelineRunResult, discover_date_videos
+from .start import GlassBatchRunner, TimelineRunResult, discover_date_videos, sanitize_identifier
 
 __all__ = [
     "GlassBatchRunner",
     "TimelineRunResult",
     "discover_date_videos",
+    "sanitize_identifier",
 ]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
@@ -25,7 +29,7 @@ from opencontext.managers.processor_manager import ContextProcessorManager
 from opencontext.models.context import RawContextProperties
 from opencontext.models.enums import ContentFormat, ContextSource
 
-KNOWN_VIDEO_EXTENSIONS = {
+KNOWN_VIDEO_EXTENSIONS = frozenset({
     ".mp4",
     ".mov",
     ".mkv",
@@ -38,16 +42,48 @@ KNOWN_VIDEO_EXTENSIONS = {
     ".flv",
     ".ts",
     ".mp2",
-}
+})
 
 
-def _sanitize_identifier(value: str) -> str:
+def sanitize_identifier(value: str) -> str:
+    """Slugify a video stem into a lowercase, dash-separated timeline identifier component."""
     normalized = re.sub(r"[^0-9a-zA-Z]+", "-", value).strip("-")
     return normalized.lower() or "video"
 
 
-def _is_video_file(path: Path) -> bool:
-    return path.is_file() and path.suffix.lower() in KNOWN_VIDEO_EXTENSIONS
+_DirSignature = Tuple[int, int, int]
+
+# Date directory as given -> (signature of every walked directory, sorted videos), LRU-bounded.
+_DISCOVERY_CACHE: OrderedDict[Tuple[str, str], Tuple[Dict[str, _DirSignature], Tuple[Path, ...]]] = OrderedDict()
+_DISCOVERY_CACHE_SIZE = 32
+_DISCOVERY_LOCK = threading.Lock()
+# Directory mtimes only advance once per filesystem timestamp tick, so a directory modified this
+# close to the walk could change again without its mtime moving; such walks are not cached.
+_DISCOVERY_SETTLE_NS = 1_000_000_000
+
+
+def _dir_signature(path: str) -> _DirSignature:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_ino, stat.st_nlink
+
+
+def _iter_video_files(root: Path, walked_dirs: Optional[Dict[str, _DirSignature]] = None) -> Iterator[Path]:
+    """Yield video files below root in one directory walk, skipping hidden directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        if walked_dirs is not None:
+            walked_dirs[dirpath] = _dir_signature(dirpath)
+        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in KNOWN_VIDEO_EXTENSIONS:
+                yield Path(dirpath, filename)
+
+
+def _directories_unchanged(walked_dirs: Dict[str, _DirSignature]) -> bool:
+    """Adding or removing an entry bumps its parent's mtime, so stat-ing each walked dir suffices."""
+    try:
+        return all(_dir_signature(dirpath) == signature for dirpath, signature in walked_dirs.items())
+    except OSError:
+        return False
 
 
 def discover_date_videos(date_dir: Path) -> List[Path]:
@@ -59,12 +95,31 @@ def discover_date_videos(date_dir: Path) -> List[Path]:
     if not date_dir.is_dir():
         raise NotADirectoryError(f"Video path is not a directory: {date_dir}")
 
-    videos = sorted(
-        path for path in date_dir.rglob("*") if _is_video_file(path)
-    )
+    # Keyed on the spelling the caller used so cached paths match a fresh walk.
+    cache_key = (str(date_dir), "" if date_dir.is_absolute() else os.getcwd())
+    with _DISCOVERY_LOCK:
+        cached = _DISCOVERY_CACHE.get(cache_key)
+    if cached is not None and _directories_unchanged(cached[0]):
+        videos = cached[1]
+    else:
+        walk_started_ns = time.time_ns()
+        walked_dirs: Dict[str, _DirSignature] = {}
+        videos = tuple(sorted(_iter_video_files(date_dir, walked_dirs)))
+        settled = all(
+            signature[0] < walk_started_ns - _DISCOVERY_SETTLE_NS for signature in walked_dirs.values()
+        )
+        with _DISCOVERY_LOCK:
+            if settled:
+                _DISCOVERY_CACHE[cache_key] = (walked_dirs, videos)
+                _DISCOVERY_CACHE.move_to_end(cache_key)
+                if len(_DISCOVERY_CACHE) > _DISCOVERY_CACHE_SIZE:
+                    _DISCOVERY_CACHE.popitem(last=False)
+            else:
+                _DISCOVERY_CACHE.pop(cache_key, None)
+
     if not videos:
         raise FileNotFoundError(f"No video files found under {date_dir}")
-    return videos
+    return list(videos)
 
 
 @dataclass(frozen=True)
@@ -118,6 +173,7 @@ class GlassBatchRunner:
         if not video_paths:
             return []
 
+        self._backfill_legacy_rows()
         report_dir = report_dir.resolve() if report_dir else None
         if report_dir:
             report_dir.mkdir(parents=True, exist_ok=True)
@@ -150,6 +206,16 @@ class GlassBatchRunner:
             )
         return results
 
+    def _backfill_legacy_rows(self) -> None:
+        # Rows recorded before segment bounds were persisted sort in Python until backfilled.
+        backfill = getattr(self._repository, "backfill_segment_bounds", None)
+        if backfill is None:
+            return
+        try:
+            backfill()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Skipping segment bound backfill: {}", exc)
+
     def _build_timeline_id(
         self,
         *,
@@ -158,7 +224,7 @@ class GlassBatchRunner:
         index: int,
         prefix: Optional[str],
     ) -> str:
-        slug = _sanitize_identifier(video_path.stem)
+        slug = sanitize_identifier(video_path.stem)
         base = prefix or date_token
         return f"{base}-{index + 1:02d}-{slug}"
 
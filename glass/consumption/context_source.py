@@ -11,7 +11,11 @@ ContextEnvelope from persisted metadata and offering convenience helpers that re
 ProcessedContext objects or their LLM string representations.
 """
 
-from typing import Iterable, List, Sequence
+import copy
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from opencontext.models.context import ProcessedContext
 from opencontext.utils.logging_utils import get_logger
@@ -21,6 +25,11 @@ from glass.storage import GlassContextRepository, Modality, MultimodalContextIte
 
 logger = get_logger(__name__)
 
+# Rendered LLM strings kept per source; report generation re-reads the same timelines often.
+_CONTEXT_STRING_CACHE_SIZE = 4096
+# Envelopes kept per source, reused until the repository reports a write.
+_ENVELOPE_CACHE_SIZE = 32
+
 
 class GlassContextSource:
     """Facade for retrieving timeline-aligned contexts from persistent storage."""
@@ -31,6 +40,13 @@ class GlassContextSource:
         repository: GlassContextRepository | None = None,
     ) -> None:
         self._repository = repository or GlassContextRepository()
+        # Keyed by (context id, update_time) so an updated context never serves a stale string.
+        self._string_cache: OrderedDict[Tuple[str, Optional[datetime]], str] = OrderedDict()
+        self._string_cache_lock = threading.Lock()
+        self._envelope_cache: OrderedDict[
+            Tuple[str, Optional[Tuple[Modality, ...]]], Tuple[object, ContextEnvelope]
+        ] = OrderedDict()
+        self._envelope_cache_lock = threading.Lock()
 
     def fetch_envelope(
         self,
@@ -42,12 +58,30 @@ class GlassContextSource:
         Load a ContextEnvelope for a timeline.
 
         Returns None when the timeline has no recorded segments or when none of the
-        segments satisfy the requested modality filter.
+        segments satisfy the requested modality filter. Envelopes are served from a shared
+        cache, so each caller gets its own envelope and item wrappers; the ProcessedContext
+        payloads themselves are shared and must be treated as read-only.
         """
         try:
+            cache_key = (timeline_id, tuple(modalities) if modalities else None)
+            version = self._repository_version()
+            if version is not None:
+                with self._envelope_cache_lock:
+                    cached = self._envelope_cache.get(cache_key)
+                    if cached is not None and cached[0] == version:
+                        self._envelope_cache.move_to_end(cache_key)
+                        return _detached(cached[1])
+
             envelope = self._repository.load_envelope(timeline_id, modalities=modalities)
             if envelope and not envelope.items:
                 return None
+            if envelope is not None and version is not None:
+                with self._envelope_cache_lock:
+                    self._envelope_cache[cache_key] = (version, envelope)
+                    self._envelope_cache.move_to_end(cache_key)
+                    if len(self._envelope_cache) > _ENVELOPE_CACHE_SIZE:
+                        self._envelope_cache.popitem(last=False)
+                return _detached(envelope)
             return envelope
         except Exception:  # noqa: BLE001
             logger.exception("Failed to load Glass envelope for timeline %s", timeline_id)
@@ -89,7 +123,7 @@ class GlassContextSource:
         strings: List[str] = []
         for context in contexts:
             try:
-                strings.append(context.get_llm_context_string())
+                strings.append(self._render_context_string(context))
             except Exception:  # noqa: BLE001
                 logger.debug(
                     "Failed to serialise context %s for timeline %s",
@@ -98,6 +132,33 @@ class GlassContextSource:
                 )
         return strings
 
+    def _repository_version(self) -> Optional[object]:
+        """Return the repository's change token, or None when it cannot provide one."""
+        data_version = getattr(self._repository, "data_version", None)
+        if data_version is None:
+            return None
+        return data_version()
+
+    def clear_string_cache(self) -> None:
+        """Drop every cached LLM context string."""
+        with self._string_cache_lock:
+            self._string_cache.clear()
+
+    def _render_context_string(self, context: ProcessedContext) -> str:
+        key = (context.id, context.properties.update_time)
+        with self._string_cache_lock:
+            cached = self._string_cache.get(key)
+            if cached is not None:
+                self._string_cache.move_to_end(key)
+                return cached
+
+        rendered = context.get_llm_context_string()
+        with self._string_cache_lock:
+            self._string_cache[key] = rendered
+            if len(self._string_cache) > _CONTEXT_STRING_CACHE_SIZE:
+                self._string_cache.popitem(last=False)
+        return rendered
+
     def group_by_context_type(
         self,
         timeline_id: str,
@@ -109,7 +170,12 @@ class GlassContextSource:
         ConsumptionManager utilities.
         """
         grouped: dict[str, List[ProcessedContext]] = {}
-        for context in self.get_processed_contexts(timeline_id, modalities=modalities):
+        envelope = self.fetch_envelope(timeline_id, modalities=modalities)
+        if not envelope:
+            return grouped
+        # Walk the (possibly cached) envelope directly rather than copying it into lists first.
+        for item in envelope.items:
+            context = item.context
             extracted = context.extracted_data
             if not extracted or not extracted.context_type:
                 continue
@@ -125,3 +191,8 @@ class GlassContextSource:
         """Convenience iterator variant of get_context_strings."""
         for context_string in self.get_context_strings(timeline_id, modalities=modalities):
             yield context_string
+
+
+def _detached(envelope: ContextEnvelope) -> ContextEnvelope:
+    """Copy a cached envelope and its item wrappers so callers cannot mutate the cache."""
+    return envelope.model_copy(update={"items": [copy.copy(item) for item in envelope.items]})
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import json
 import uuid
 import wave
 from dataclasses import dataclass, fields
@@ -9,11 +10,19 @@ from typing import Any, Mapping, Optional
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .models import AlignmentSegment, SegmentType
 from .speech_to_text import SpeechToTextRunner, TranscriptionResult
 
 
+# Raw bytes read per base64 step; a multiple of 3 keeps each encoded chunk padding-free.
+_BASE64_READ_CHUNK = 3 * 256 * 1024
+# Transient gateway failures are retried on the pooled default session.
+_RETRY_STATUS_CODES = (502, 503, 504)
+
+
 class AUCTurboError(RuntimeError):
     """Raised when the AUC Turbo API returns an error response."""
 
@@ -57,7 +66,7 @@ class AUCTurboRunner(SpeechToTextRunner):
         if not config.app_key or not config.access_key:
             raise ValueError("AUC Turbo app_key and access_key must be configured")
         self._config = config
-        self._session = session or requests.Session()
+        self._session = session or _build_pooled_session()
 
     def transcribe(self, audio_path: Path, *, timeline_id: str) -> TranscriptionResult:
         if not audio_path.exists():
@@ -77,14 +86,14 @@ class AUCTurboRunner(SpeechToTextRunner):
                 f"{self._config.max_duration_sec}s"
             )
 
-        payload = self._build_payload(audio_path)
+        body = self._build_body(audio_path)
         headers = self._build_headers()
         request_id = headers["X-Api-Request-Id"]
         try:
             response = self._session.post(
                 self._config.build_url(),
                 headers=headers,
-                json=payload,
+                data=body,
                 timeout=self._config.request_timeout,
             )
         except requests.RequestException as exc:  # noqa: PERF203 - clarity matters
@@ -123,13 +132,26 @@ class AUCTurboRunner(SpeechToTextRunner):
             "X-Api-Sequence": "-1",
         }
 
-    def _build_payload(self, audio_path: Path) -> dict[str, Any]:
-        encoded_audio = base64.b64encode(audio_path.read_bytes()).decode("ascii")
-        return {
-            "user": {"uid": str(self._config.app_key)},
-            "audio": {"data": encoded_audio},
-            "request": {"model_name": self._config.model_name},
-        }
+    def _build_body(self, audio_path: Path) -> bytes:
+        """
+        Serialise the JSON request body with the audio inlined as base64.
+
+        The audio is encoded chunk by chunk straight into the body instead of going through
+        bytes -> base64 str -> json.dumps, which held several full-size copies of the file.
+        """
+        envelope = json.dumps(
+            {
+                "user": {"uid": str(self._config.app_key)},
+                "request": {"model_name": self._config.model_name},
+            }
+        )
+        parts = [envelope[:-1].encode("utf-8"), b', "audio": {"data": "']
+        with audio_path.open("rb") as handle:
+            # Multiples of 3 bytes encode to base64 without padding, so chunks concatenate cleanly.
+            while chunk := handle.read(_BASE64_READ_CHUNK):
+                parts.append(base64.b64encode(chunk))
+        parts.append(b'"}}')
+        return b"".join(parts)
 
     def _parse_segments(self, payload: dict[str, Any]) -> list[AlignmentSegment]:
         result = payload.get("result") or {}
@@ -175,3 +197,20 @@ class AUCTurboRunner(SpeechToTextRunner):
             return data.get("message") or data.get("error_msg") or response.text
         except ValueError:
             return response.text or "unknown error"
+
+
+def _build_pooled_session() -> requests.Session:
+    """Keep-alive session shared across transcriptions, retrying transient gateway errors."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=_RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"POST"}),
+        # Hand the final response back so transcribe() reports the HTTP status itself.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
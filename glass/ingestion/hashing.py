@@ -0,0 +1,37 @@
+"""
+Content hashing helpers for Glass ingestion artefacts.
+
+Digests identify videos, audio tracks, and frames by content so callers can reuse
+previous work. BLAKE2b is used throughout: it is faster than SHA-256 on commodity
+CPUs and its digest size can be trimmed for compact cache keys.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+_READ_CHUNK_SIZE = 256 * 1024
+
+
+def compute_file_digest(path: Path | str, *, digest_size: int = 32) -> str:
+    """Return the hex BLAKE2b digest of a file without loading it into memory."""
+    with open(path, "rb") as handle:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read/update loop runs in C with the GIL released.
+            digest = hashlib.file_digest(
+                handle,
+                lambda: hashlib.blake2b(digest_size=digest_size),
+            )
+            return digest.hexdigest()
+
+        digest = hashlib.blake2b(digest_size=digest_size)
+        buffer = bytearray(_READ_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+        return digest.hexdigest()
+
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import threading
 import uuid
 from pathlib import Path
 from typing import Optional
@@ -9,6 +11,7 @@ from typing import Optional
 from loguru import logger
 
 from .ffmpeg_runner import FFmpegRunner
+from .hashing import compute_file_digest
 from .models import AlignmentManifest, AlignmentSegment, IngestionStatus, SegmentType
 from .video_manager import TimelineNotFoundError, VideoManager
 from .speech_to_text import SpeechToTextRunner, TranscriptionResult
@@ -26,6 +29,7 @@ class LocalVideoManager(VideoManager):
     STATUS_FILE = "status.json"
     MANIFEST_FILE = "alignment_manifest.json"
     RAW_TRANSCRIPT_FILE = "transcription_raw.json"
+    SIGNATURE_INDEX_FILE = "video_signatures.json"
 
     def __init__(
         self,
@@ -44,6 +48,7 @@ class LocalVideoManager(VideoManager):
         self._ffmpeg = ffmpeg_runner or FFmpegRunner()
         self._speech = speech_runner
         self._frame_rate = frame_rate
+        self._signature_lock = threading.Lock()
 
         self._base_dir.mkdir(parents=True, exist_ok=True)
 
@@ -61,6 +66,11 @@ class LocalVideoManager(VideoManager):
             logger.info("Manifest already exists for timeline {}, returning cached result", timeline)
             return AlignmentManifest.model_validate_json(manifest_path.read_text())
 
+        signature = self._video_signature(source_path)
+        reused = self._reuse_ingested_video(signature, timeline, timeline_dir)
+        if reused is not None:
+            return reused
+
         logger.info("Starting ingestion for timeline {} from {}", timeline, source_path)
         self._write_status(timeline_dir, IngestionStatus.PROCESSING)
 
@@ -95,6 +105,7 @@ class LocalVideoManager(VideoManager):
             manifest_path.write_text(manifest.to_json())
             self._write_raw_transcription(timeline_dir, transcription)
             self._write_status(timeline_dir, IngestionStatus.COMPLETED)
+            self._record_signature(signature, timeline)
             logger.info("Finished ingestion for timeline {}", timeline)
             return manifest
         except Exception as exc:  # noqa: BLE001
@@ -122,13 +133,90 @@ class LocalVideoManager(VideoManager):
             raise TimelineNotFoundError(timeline_id)
         return AlignmentManifest.model_validate_json(manifest_path.read_text())
 
+    def _video_signature(self, source_path: Path) -> str:
+        # Frames depend on the sampling rate, so the same video at another rate is new work.
+        return f"{compute_file_digest(source_path, digest_size=16)}@{self._frame_rate:g}"
+
+    def _reuse_ingested_video(
+        self, signature: str, timeline: str, timeline_dir: Path
+    ) -> Optional[AlignmentManifest]:
+        """
+        Mirror a completed ingestion of identical video content onto the requested timeline.
+
+        Artefacts are hard-linked (or copied across filesystems) so the new timeline owns its
+        files and outlives any cleanup of the original one.
+        """
+        previous = self._load_signature_index().get(signature)
+        if not previous or previous == timeline:
+            return None
+        previous_dir = self._base_dir / previous
+        try:
+            if self.get_status(previous) is not IngestionStatus.COMPLETED:
+                return None
+            cached = AlignmentManifest.model_validate_json((previous_dir / self.MANIFEST_FILE).read_text())
+            self._link_artefacts(previous_dir, timeline_dir)
+        except (TimelineNotFoundError, OSError, ValueError):
+            return None
+
+        manifest = AlignmentManifest(
+            timeline_id=timeline,
+            source=_rebase_path(cached.source, previous_dir, timeline_dir),
+            segments=[
+                segment.model_copy(update={"payload": _rebase_path(segment.payload, previous_dir, timeline_dir)})
+                if segment.type is SegmentType.FRAME
+                else segment
+                for segment in cached.segments
+            ],
+        )
+        (timeline_dir / self.MANIFEST_FILE).write_text(manifest.to_json())
+        self._write_status(timeline_dir, IngestionStatus.COMPLETED)
+        logger.info("Video for timeline {} matches timeline {}, reusing its manifest", timeline, previous)
+        return manifest
+
+    def _link_artefacts(self, source_dir: Path, target_dir: Path) -> None:
+        skipped = {self.STATUS_FILE, self.MANIFEST_FILE}
+        for path in source_dir.rglob("*"):
+            if path.is_dir() or path.name in skipped:
+                continue
+            target = target_dir / path.relative_to(source_dir)
+            if target.exists():
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copy2(path, target)
+
+    def _load_signature_index(self) -> dict[str, str]:
+        index_path = self._base_dir / self.SIGNATURE_INDEX_FILE
+        try:
+            return json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _record_signature(self, signature: str, timeline: str) -> None:
+        index_path = self._base_dir / self.SIGNATURE_INDEX_FILE
+        with self._signature_lock:
+            index = self._load_signature_index()
+            index[signature] = timeline
+            temp_path = index_path.with_suffix(".tmp")
+            try:
+                temp_path.write_text(json.dumps(index, indent=2))
+                os.replace(temp_path, index_path)
+            except OSError as exc:
+                logger.warning("Failed to record video signature for timeline {}: {}", timeline, exc)
+
     def _write_status(self, timeline_dir: Path, status: IngestionStatus) -> None:
         payload = {"status": status.value}
         (timeline_dir / self.STATUS_FILE).write_text(json.dumps(payload, indent=2))
 
     def _write_raw_transcription(self, timeline_dir: Path, transcription: TranscriptionResult) -> None:
         raw_path = timeline_dir / self.RAW_TRANSCRIPT_FILE
-        raw_path.write_text(json.dumps(transcription.raw_response, indent=2))
+        # Raw ASR payloads can be large; write them compact and without escaping non-ASCII text.
+        raw_path.write_text(
+            json.dumps(transcription.raw_response, separators=(",", ":"), ensure_ascii=False),
+            encoding="utf-8",
+        )
 
     def _build_manifest(
         self,
@@ -164,3 +252,11 @@ class LocalVideoManager(VideoManager):
     @staticmethod
     def _generate_timeline_id() -> str:
         return uuid.uuid4().hex
+
+
+def _rebase_path(value: str, old_root: Path, new_root: Path) -> str:
+    """Point ``value`` at ``new_root`` when it lives below ``old_root``; leave anything else untouched."""
+    try:
+        return str(new_root / Path(value).relative_to(old_root))
+    except ValueError:
+        return value
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Iterable
+from typing import Iterable, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class SegmentType(str, Enum):
@@ -43,26 +43,39 @@ class AlignmentManifest(BaseModel):
     timeline_id: str
     source: str = Field(..., description="Original source of the ingested video.")
     segments: list[AlignmentSegment] = Field(default_factory=list)
+    # Start-ordered segments per modality, built on first filtered iteration so later ones skip a
+    # full scan. Rebuilt whenever `segments` is replaced or resized (e.g. after model_construct).
+    _segments_by_type: Optional[dict[SegmentType, list[AlignmentSegment]]] = PrivateAttr(default=None)
+    _indexed_segments: Optional[tuple[list[AlignmentSegment], int]] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
     def ensure_ordered_segments(self) -> "AlignmentManifest":
         if not self.segments:
             raise ValueError("alignment manifest requires at least one segment")
 
-        ordered = sorted(self.segments, key=lambda segment: segment.start)
-        if ordered != self.segments:
-            self.segments = ordered
+        # Compare start floats only; list equality would compare every segment model field by field.
+        starts = [segment.start for segment in self.segments]
+        if any(later < earlier for earlier, later in zip(starts, starts[1:])):
+            self.segments = sorted(self.segments, key=lambda segment: segment.start)
         return self
 
     def iter_segments(self, segment_type: SegmentType | None = None) -> Iterable[AlignmentSegment]:
         """Iterate over segments, optionally filtered by modality."""
         if segment_type is None:
-            yield from self.segments
-            return
-
-        for segment in self.segments:
-            if segment.type is segment_type:
-                yield segment
+            return iter(self.segments)
+        return iter(self._segments_index().get(segment_type, ()))
+
+    def _segments_index(self) -> dict[SegmentType, list[AlignmentSegment]]:
+        segments = self.segments
+        indexed = self._indexed_segments
+        by_type = self._segments_by_type
+        if by_type is None or indexed is None or indexed[0] is not segments or indexed[1] != len(segments):
+            by_type = {}
+            for segment in segments:
+                by_type.setdefault(segment.type, []).append(segment)
+            self._segments_by_type = by_type
+            self._indexed_segments = (segments, len(segments))
+        return by_type
 
     def to_json(self) -> str:
         """Serialize the manifest in a stable JSON form suitable for persistence."""
@@ -8,13 +8,16 @@ manager by translating AlignmentManifest payloads into ProcessedContext objects
 and storing them through GlassContextRepository.
 """
 
+import queue
+import threading
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from opencontext.context_processing.processor.base_processor import BaseContextProcessor
-from opencontext.models.context import ProcessedContext, RawContextProperties
+from opencontext.models.context import ProcessedContext, RawContextProperties, Vectorize
 from opencontext.utils.logging_utils import get_logger
 
+from glass.ingestion.hashing import compute_file_digest
 from glass.ingestion.models import AlignmentManifest
 from glass.processing.chunkers import ManifestChunker
 from glass.processing.envelope import ContextEnvelope
@@ -24,6 +27,10 @@ from glass.storage.models import Modality, MultimodalContextItem
 
 logger = get_logger(__name__)
 
+# Items per encode/upsert batch and how many encoded batches may wait to be persisted.
+_PIPELINE_BATCH_SIZE = 64
+_PIPELINE_QUEUE_DEPTH = 8
+
 
 class GlassTimelineProcessor(BaseContextProcessor):
     """Route timeline manifests into the MineContext processing pipeline."""
@@ -83,21 +90,19 @@ class GlassTimelineProcessor(BaseContextProcessor):
             logger.warning("Manifest for timeline %s produced no context items", manifest.timeline_id)
             return []
 
-        self._ensure_visual_embeddings(items)
-        envelope = ContextEnvelope.from_items(
-            timeline_id=manifest.timeline_id,
-            source=manifest.source,
-            items=items,
-        )
-        self._last_envelope = envelope
-
         try:
-            self._repository.upsert_aligned_segments(items)
+            self._encode_and_persist(items)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Failed to persist contexts for timeline %s: %s", manifest.timeline_id, exc)
             self._processing_stats["error_count"] += 1
             return []
 
+        self._last_envelope = ContextEnvelope.from_items(
+            timeline_id=manifest.timeline_id,
+            source=manifest.source,
+            items=items,
+        )
+
         processed_contexts = [item.context for item in items]
         self._processing_stats["processed_count"] += 1
         self._processing_stats["contexts_generated_count"] += len(processed_contexts)
@@ -112,6 +117,9 @@ class GlassTimelineProcessor(BaseContextProcessor):
 
     def shutdown(self, graceful: bool = False) -> bool:
         logger.info("Shutting down GlassTimelineProcessor (graceful=%s)", graceful)
+        close = getattr(self._repository, "close", None)
+        if close is not None:
+            close()
         return True
 
     @property
@@ -134,13 +142,142 @@ class GlassTimelineProcessor(BaseContextProcessor):
 
         raise ValueError("No manifest payload supplied for timeline context")
 
+    def _encode_and_persist(self, items: List[MultimodalContextItem]) -> None:
+        """
+        Encode frames and upsert items batch by batch.
+
+        Small manifests go through a single encode + upsert. Larger ones overlap the
+        two stages: an encoder thread runs the visual encoder for batch N+1 while the
+        calling thread persists batch N. Every repository call (cache lookups, cache
+        writes, upserts) stays on the calling thread, so injected connections opened
+        with check_same_thread=True keep working. Each batch commits on its own, so no
+        write transaction is held while the encoder waits on remote embedding calls.
+        """
+        if len(items) <= _PIPELINE_BATCH_SIZE:
+            self._ensure_visual_embeddings(items)
+            self._repository.upsert_aligned_segments(items)
+            return
+
+        batches = [
+            items[start : start + _PIPELINE_BATCH_SIZE]
+            for start in range(0, len(items), _PIPELINE_BATCH_SIZE)
+        ]
+        pending = [self._pending_frame_encodings(batch) for batch in batches]
+
+        encoded: "queue.Queue[Tuple[int, object]]" = queue.Queue(maxsize=_PIPELINE_QUEUE_DEPTH)
+        stop = threading.Event()
+
+        def _encode_batches() -> None:
+            for index, to_encode in enumerate(pending):
+                if stop.is_set():
+                    return
+                try:
+                    result: object = self._encode_frames(to_encode)
+                except BaseException as exc:  # noqa: BLE001
+                    result = exc
+                while not stop.is_set():
+                    try:
+                        encoded.put((index, result), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if isinstance(result, BaseException):
+                    return
+
+        encoder = threading.Thread(target=_encode_batches, name="glass-timeline-encoder", daemon=True)
+        encoder.start()
+        try:
+            for index, batch in enumerate(batches):
+                _, result = encoded.get()
+                if isinstance(result, BaseException):
+                    raise result
+                self._apply_frame_encodings(pending[index], result)
+                self._repository.upsert_aligned_segments(batch)
+        finally:
+            stop.set()
+            encoder.join()
+
     def _ensure_visual_embeddings(self, items: Iterable[MultimodalContextItem]) -> None:
+        to_encode = self._pending_frame_encodings(items)
+        if to_encode:
+            self._apply_frame_encodings(to_encode, self._encode_frames(to_encode))
+
+    def _pending_frame_encodings(
+        self, items: Iterable[MultimodalContextItem]
+    ) -> List[Tuple[MultimodalContextItem, Optional[str]]]:
+        """Fill frame vectors from the embedding cache and return the frames still to encode."""
+        pending: List[MultimodalContextItem] = []
         for item in items:
             if item.modality is Modality.FRAME and item.context.vectorize:
                 if item.context.vectorize.vector:
                     item.embedding_ready = True
                     continue
+                pending.append(item)
+
+        if not pending:
+            return []
+
+        # Cached vectors are only valid for the model that produced them; without one, skip the cache.
+        model_key = getattr(self._visual_encoder, "model_key", None)
+        digests = [_frame_digest(item.content_ref) if model_key else None for item in pending]
+        cached = self._load_cached_embeddings([digest for digest in digests if digest], model_key)
+        to_encode: List[Tuple[MultimodalContextItem, Optional[str]]] = []
+        for item, digest in zip(pending, digests):
+            vector = cached.get(digest) if digest else None
+            if vector:
+                item.context.vectorize.vector = vector
+                item.embedding_ready = True
+            else:
+                to_encode.append((item, digest))
+        return to_encode
+
+    def _encode_frames(self, to_encode: List[Tuple[MultimodalContextItem, Optional[str]]]) -> List[Vectorize]:
+        """Run the visual encoder only; touches no repository state, so it is safe off-thread."""
+        if not to_encode:
+            return []
+        # Encode all outstanding frames in one call; encoders without batching fall back per frame.
+        encode_batch = getattr(self._visual_encoder, "encode_batch", None)
+        image_paths = [item.content_ref for item, _ in to_encode]
+        if encode_batch is not None:
+            return list(encode_batch(image_paths))
+        return [self._visual_encoder.encode(image_path) for image_path in image_paths]
+
+    def _apply_frame_encodings(
+        self,
+        to_encode: List[Tuple[MultimodalContextItem, Optional[str]]],
+        vectorizes: List[Vectorize],
+    ) -> None:
+        fresh: dict[str, List[float]] = {}
+        for (item, digest), vectorize in zip(to_encode, vectorizes):
+            item.context.vectorize = vectorize
+            item.embedding_ready = bool(vectorize.vector)
+            if digest and vectorize.vector:
+                fresh[digest] = vectorize.vector
+        self._store_cached_embeddings(fresh, getattr(self._visual_encoder, "model_key", None))
+
+    def _load_cached_embeddings(self, digests: List[str], model_key: Optional[str]) -> dict[str, List[float]]:
+        fetch = getattr(self._repository, "fetch_cached_embeddings", None)
+        if fetch is None or not digests or not model_key:
+            return {}
+        try:
+            return fetch(digests, model_key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Embedding cache lookup failed; encoding all frames: %s", exc)
+            return {}
+
+    def _store_cached_embeddings(self, vectors: dict[str, List[float]], model_key: Optional[str]) -> None:
+        store = getattr(self._repository, "store_cached_embeddings", None)
+        if store is None or not vectors or not model_key:
+            return
+        try:
+            store(vectors, model_key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to persist %s frame embeddings to cache: %s", len(vectors), exc)
+
 
-                vectorize = self._visual_encoder.encode(item.content_ref)
-                item.context.vectorize = vectorize
-                item.embedding_ready = bool(vectorize.vector)
+def _frame_digest(image_path: str) -> Optional[str]:
+    """Content digest used as the embedding cache key; None when the frame is unreadable."""
+    try:
+        return compute_file_digest(image_path, digest_size=16)
+    except OSError:
+        return None
@@ -7,6 +7,9 @@ is not configured it will simply return the Vectorize object untouched so the
 caller can decide when to retry.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
 from opencontext.llm import global_embedding_client
 from opencontext.models.context import Vectorize
 from opencontext.models.enums import ContentFormat
@@ -14,14 +17,30 @@ from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Embedding calls are remote round trips, so a batch overlaps a handful of them.
+_MAX_BATCH_WORKERS = 4
+
 
 class VisualEncoder:
     """Encode frame images into vector representations when possible."""
 
+    @property
+    def model_key(self) -> Optional[str]:
+        """Embedding model and dimension the vectors come from; None while the client is unconfigured."""
+        return global_embedding_client.model_signature()
+
     def encode(self, image_path: str) -> Vectorize:
         vectorize = Vectorize(content_format=ContentFormat.IMAGE, image_path=image_path)
         return self._maybe_vectorize(vectorize)
 
+    def encode_batch(self, image_paths: Sequence[str]) -> List[Vectorize]:
+        """Encode several frames, returning results in the order of ``image_paths``."""
+        if len(image_paths) <= 1 or not global_embedding_client.is_initialized():
+            return [self.encode(image_path) for image_path in image_paths]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(image_paths))) as executor:
+            return list(executor.map(self.encode, image_paths))
+
     def _maybe_vectorize(self, vectorize: Vectorize) -> Vectorize:
         if not global_embedding_client.is_initialized():
             logger.debug("Embedding client not initialised; skipping eager vectorisation for %s", vectorize.image_path)
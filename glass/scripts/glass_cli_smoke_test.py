@@ -8,9 +8,9 @@ all tracked videos found under `videos/<dd-mm>/`. Unlike the original smoke test
 relies on the real ffmpeg tooling, the Glass storage path, and the Doubao AUC
 Turbo (火山极速识别) speech service.
 
-Usage (run from repository root):
+Usage (run from repository root, or pass --repo-root):
 
-    uv run python glass/scripts/glass_cli_smoke_test.py --auc-app-key xxx --auc-access-key yyy
+    uv run glass-smoke --auc-app-key xxx --auc-access-key yyy
 
 Expectations:
 1. An isolated `CONTEXT_PATH` workspace is created under `persist/glass_cli_smoke/`.
@@ -23,15 +23,15 @@ Expectations:
 import argparse
 import mimetypes
 import os
-import re
 import subprocess
 import sys
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-REPO_ROOT = Path(__file__).resolve().parents[2]
-if str(REPO_ROOT) not in sys.path:
-    sys.path.insert(0, str(REPO_ROOT))
 
 from opencontext.config.global_config import GlobalConfig
 from opencontext.managers.processor_manager import ContextProcessorManager
@@ -39,26 +39,16 @@ from opencontext.models.context import RawContextProperties
 from opencontext.models.enums import ContentFormat, ContextSource
 from opencontext.storage.global_storage import GlobalStorage
 
+from glass.commands import sanitize_identifier
+from glass.commands.start import KNOWN_VIDEO_EXTENSIONS
 from glass.ingestion import AUCTurboConfig, AUCTurboRunner, FFmpegRunner, LocalVideoManager
 from glass.processing.chunkers import ManifestChunker
 from glass.processing.timeline_processor import GlassTimelineProcessor
 from glass.processing.visual_encoder import VisualEncoder
 from glass.storage.context_repository import GlassContextRepository
 
-KNOWN_VIDEO_EXTENSIONS = {
-    ".mp4",
-    ".mov",
-    ".mkv",
-    ".avi",
-    ".webm",
-    ".mpg",
-    ".mpeg",
-    ".m4v",
-    ".wmv",
-    ".flv",
-    ".ts",
-    ".mp2",
-}
+
+_MAX_PENDING_VIDEOS = 2
 
 
 def _is_video_file(path: Path) -> bool:
@@ -94,23 +84,10 @@ def _discover_video_paths(repo_root: Path, override: str | None) -> list[Path]:
     return videos
 
 
-def _sanitize_identifier(value: str) -> str:
-    """Sanitize strings for safe reuse in run/timeline identifiers."""
-    normalized = re.sub(r"[^0-9a-zA-Z]+", "-", value).strip("-")
-    return normalized.lower() or "video"
-
-
-def _derive_run_id(
-    base_run_id: str | None,
-    sample_video: Path,
-    *,
-    batch_token: str,
-    index: int,
-) -> str:
-    suffix = f"{index + 1:02d}-{_sanitize_identifier(sample_video.stem)}"
-    if base_run_id:
-        return f"{base_run_id}-{suffix}"
-    return f"{batch_token}-{suffix}"
+def _resolve_repo_root(args: argparse.Namespace) -> Path:
+    """Return the checkout holding config/, videos/, and persist/; defaults to the working directory."""
+    override = getattr(args, "repo_root", None)
+    return Path(override).expanduser().resolve() if override else Path.cwd()
 
 
 def _derive_timeline_id(
@@ -119,29 +96,54 @@ def _derive_timeline_id(
     *,
     index: int,
 ) -> str:
-    suffix = f"{index + 1:02d}-{_sanitize_identifier(sample_video.stem)}"
+    suffix = f"{index + 1:02d}-{sanitize_identifier(sample_video.stem)}"
     if base_timeline_id:
         return f"{base_timeline_id}-{suffix}"
     return f"smoke-{suffix}"
 
 
-def _coalesce_numeric_cli_env(
-    cli_value: float | None,
-    env_name: str,
-    default: float,
-) -> float:
-    """Pick the CLI value, fall back to env var, then default."""
-    if cli_value is not None:
-        return cli_value
+def _parse_numeric_env(env_name: str) -> float | None:
     env_value = os.getenv(env_name)
     if env_value is None:
-        return default
+        return None
     try:
         return float(env_value)
     except ValueError as exc:  # noqa: B904 - want context
         raise ValueError(f"Environment variable {env_name} must be numeric") from exc
 
 
+@dataclass(frozen=True)
+class _NumericEnvDefaults:
+    """Numeric AUC overrides read from the environment; None when unset."""
+
+    request_timeout: float | None = None
+    max_file_size_mb: float | None = None
+    max_duration_sec: float | None = None
+
+    @classmethod
+    def from_environ(cls) -> "_NumericEnvDefaults":
+        return cls(
+            request_timeout=_parse_numeric_env("AUC_REQUEST_TIMEOUT"),
+            max_file_size_mb=_parse_numeric_env("AUC_MAX_FILE_SIZE_MB"),
+            max_duration_sec=_parse_numeric_env("AUC_MAX_DURATION_SEC"),
+        )
+
+
+@lru_cache(maxsize=1)
+def _numeric_env_defaults() -> _NumericEnvDefaults:
+    """Parse the numeric env overrides once per process."""
+    return _NumericEnvDefaults.from_environ()
+
+
+def _coalesce_numeric(cli_value: float | None, env_value: float | None, default: float) -> float:
+    """Pick the CLI value, fall back to the env override, then default."""
+    if cli_value is not None:
+        return cli_value
+    if env_value is not None:
+        return env_value
+    return default
+
+
 def _load_auc_config_from_global() -> AUCTurboConfig:
     """Load the AUC Turbo config from GlobalConfig, falling back to defaults."""
     try:
@@ -157,6 +159,7 @@ def _load_auc_config_from_global() -> AUCTurboConfig:
 def _build_auc_runner(args: argparse.Namespace) -> AUCTurboRunner:
     """Instantiate an AUC Turbo runner from CLI/env configuration."""
     base = _load_auc_config_from_global()
+    env_defaults = _numeric_env_defaults()
     app_key = args.auc_app_key or os.getenv("AUC_APP_KEY") or base.app_key
     access_key = args.auc_access_key or os.getenv("AUC_ACCESS_KEY") or base.access_key
     if not app_key or not access_key:
@@ -171,19 +174,19 @@ def _build_auc_runner(args: argparse.Namespace) -> AUCTurboRunner:
         app_key=app_key,
         access_key=access_key,
         model_name=args.auc_model_name or os.getenv("AUC_MODEL_NAME") or base.model_name,
-        request_timeout=_coalesce_numeric_cli_env(
+        request_timeout=_coalesce_numeric(
             args.auc_timeout,
-            "AUC_REQUEST_TIMEOUT",
+            env_defaults.request_timeout,
             base.request_timeout,
         ),
-        max_file_size_mb=_coalesce_numeric_cli_env(
+        max_file_size_mb=_coalesce_numeric(
             args.auc_max_size_mb,
-            "AUC_MAX_FILE_SIZE_MB",
+            env_defaults.max_file_size_mb,
             base.max_file_size_mb,
         ),
-        max_duration_sec=_coalesce_numeric_cli_env(
+        max_duration_sec=_coalesce_numeric(
             args.auc_max_duration_sec,
-            "AUC_MAX_DURATION_SEC",
+            env_defaults.max_duration_sec,
             base.max_duration_sec,
         ),
         endpoint_path=args.auc_endpoint or os.getenv("AUC_ENDPOINT_PATH") or base.endpoint_path,
@@ -250,8 +253,14 @@ def _invoke_cli_report(
     *,
     report_path: Path,
     lookback_minutes: int = 120,
-) -> subprocess.CompletedProcess[str]:
-    """Call the CLI report command via a subprocess."""
+) -> None:
+    """
+    Call the CLI report command via a subprocess.
+
+    The child's stdout/stderr are merged and forwarded line by line as they arrive,
+    so memory stays flat regardless of log volume. Raises CalledProcessError on a
+    non-zero exit.
+    """
     env = os.environ.copy()
     env["GLASS_SMOKE_TIMELINE"] = timeline_id
     command = [
@@ -267,13 +276,20 @@ def _invoke_cli_report(
         "--output",
         str(report_path),
     ]
-    return subprocess.run(
+    with subprocess.Popen(
         command,
-        check=True,
         env=env,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
-    )
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            sys.stdout.write(line)
+        returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command)
 
 
 def _summarize_repository(repo: GlassContextRepository, timeline_id: str) -> int:
@@ -281,16 +297,19 @@ def _summarize_repository(repo: GlassContextRepository, timeline_id: str) -> int
     return len(repo.fetch_by_timeline(timeline_id))
 
 
-def run_smoke_test(
-    args: argparse.Namespace,
-    sample_video: Path,
-    *,
-    run_id: str | None = None,
-    timeline_id: str | None = None,
-) -> Path:
-    """Execute the end-to-end smoke workflow and return the report path."""
-    repo_root = Path(__file__).resolve().parents[2]
-    run_dir = _prepare_workspace(repo_root, override=run_id or args.run_id)
+@dataclass(frozen=True)
+class SmokePipeline:
+    """Long-lived objects shared by every video in a smoke batch."""
+
+    run_dir: Path
+    repository: GlassContextRepository
+    processor_manager: ContextProcessorManager
+    video_manager: LocalVideoManager
+
+
+def _build_pipeline(args: argparse.Namespace, repo_root: Path, *, run_id: str | None) -> SmokePipeline:
+    """Prepare the workspace and initialise config, storage, and runners exactly once."""
+    run_dir = _prepare_workspace(repo_root, override=run_id)
     _initialize_singletons(repo_root / "config" / "config.yaml")
 
     repository = GlassContextRepository()
@@ -298,47 +317,60 @@ def run_smoke_test(
 
     ffmpeg_runner = FFmpegRunner(ffmpeg_executable=args.ffmpeg_bin)
     speech_runner = _build_auc_runner(args)
-    ingestion_dir = run_dir / "ingestion"
     video_manager = LocalVideoManager(
-        base_dir=ingestion_dir,
+        base_dir=run_dir / "ingestion",
         frame_rate=args.frame_rate,
         ffmpeg_runner=ffmpeg_runner,
         speech_runner=speech_runner,
     )
-
-    timeline_identifier = timeline_id or args.timeline_id or f"smoke-{int(time.time())}"
-    manifest_json = _ingest_sample_video(
-        video_manager,
-        sample_video,
-        timeline_id=timeline_identifier,
+    return SmokePipeline(
+        run_dir=run_dir,
+        repository=repository,
+        processor_manager=processor_manager,
+        video_manager=video_manager,
     )
 
+
+def _process_and_report(
+    pipeline: SmokePipeline,
+    args: argparse.Namespace,
+    *,
+    timeline_id: str,
+    manifest_json: str,
+) -> Path:
+    """Process an ingested manifest and generate the CLI report for it."""
     raw_context = RawContextProperties(
         content_format=ContentFormat.VIDEO,
         source=ContextSource.VIDEO,
         create_time=datetime.now(timezone.utc),
         additional_info={
-            "timeline_id": timeline_identifier,
+            "timeline_id": timeline_id,
             "alignment_manifest": manifest_json,
         },
     )
-    processed_contexts = processor_manager.process(raw_context)
+    processed_contexts = pipeline.processor_manager.process(raw_context)
     if not processed_contexts:
         raise RuntimeError("Glass timeline processor did not emit any processed contexts.")
 
-    if _summarize_repository(repository, timeline_identifier) == 0:
+    if _summarize_repository(pipeline.repository, timeline_id) == 0:
         raise RuntimeError("Glass context repository has no records for the timeline.")
 
-    report_path = run_dir / "glass_report.md"
-    result = _invoke_cli_report(
-        timeline_identifier,
+    return _generate_report(pipeline, args, timeline_id=timeline_id)
+
+
+def _generate_report(
+    pipeline: SmokePipeline,
+    args: argparse.Namespace,
+    *,
+    timeline_id: str,
+) -> Path:
+    """Run the CLI report for an already processed timeline."""
+    report_path = pipeline.run_dir / f"{timeline_id}_report.md"
+    _invoke_cli_report(
+        timeline_id,
         report_path=report_path,
         lookback_minutes=args.lookback_minutes,
     )
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.stderr:
-        print(result.stderr.strip())
 
     if not report_path.exists() or report_path.stat().st_size == 0:
         raise RuntimeError("CLI did not produce a report file.")
@@ -346,15 +378,85 @@ def run_smoke_test(
     return report_path
 
 
+def _should_skip_processing(
+    pipeline: SmokePipeline,
+    args: argparse.Namespace,
+    timeline_id: str,
+) -> bool:
+    """
+    Return True when a previous run already persisted this timeline.
+
+    Records live in the per-run workspace, so this only fires when --run-id names an
+    existing run; a default, freshly timestamped workspace is always empty.
+    """
+    if args.force or _summarize_repository(pipeline.repository, timeline_id) == 0:
+        return False
+    print(f"Timeline {timeline_id} already populated, skipping to report (use --force to rerun).")
+    return True
+
+
+def _run_single_video(
+    pipeline: SmokePipeline,
+    args: argparse.Namespace,
+    sample_video: Path,
+    *,
+    timeline_id: str,
+) -> Path:
+    """Ingest, process, and report a single video using the shared pipeline."""
+    if _should_skip_processing(pipeline, args, timeline_id):
+        return _generate_report(pipeline, args, timeline_id=timeline_id)
+
+    manifest_json = _ingest_sample_video(
+        pipeline.video_manager,
+        sample_video,
+        timeline_id=timeline_id,
+    )
+    return _process_and_report(
+        pipeline,
+        args,
+        timeline_id=timeline_id,
+        manifest_json=manifest_json,
+    )
+
+
+def run_smoke_test(
+    args: argparse.Namespace,
+    sample_video: Path,
+    *,
+    run_id: str | None = None,
+    timeline_id: str | None = None,
+) -> Path:
+    """Execute the end-to-end smoke workflow for one video and return the report path."""
+    pipeline = _build_pipeline(args, _resolve_repo_root(args), run_id=run_id or args.run_id)
+    timeline_identifier = timeline_id or args.timeline_id or f"smoke-{int(time.time())}"
+    return _run_single_video(pipeline, args, sample_video, timeline_id=timeline_identifier)
+
+
 def _build_argument_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Smoke-test Glass CLI report generation.")
+    parser.add_argument(
+        "--repo-root",
+        help="Repository checkout holding config/, videos/, and persist/ (default: current directory).",
+    )
     parser.add_argument(
         "--timeline-id",
         help="Optional fixed timeline identifier to reuse across runs.",
     )
     parser.add_argument(
         "--run-id",
-        help="Optional run directory name under persist/glass_cli_smoke/.",
+        help=(
+            "Optional run directory name under persist/glass_cli_smoke/. Each run defaults to a "
+            "fresh timestamped directory; pass the same --run-id to reuse a workspace and skip "
+            "timelines it already populated."
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "Re-ingest and re-process timelines that already have persisted records "
+            "(only relevant when --run-id reuses a workspace)."
+        ),
     )
     parser.add_argument(
         "--frame-rate",
@@ -421,27 +523,45 @@ def _build_argument_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = _build_argument_parser()
     args = parser.parse_args()
-    repo_root = Path(__file__).resolve().parents[2]
+    repo_root = _resolve_repo_root(args)
     batch_token = datetime.now(timezone.utc).strftime("run-%Y%m%dT%H%M%SZ")
     videos = _discover_video_paths(repo_root, args.video_path)
 
-    for index, sample_video in enumerate(videos):
-        run_id = _derive_run_id(args.run_id, sample_video, batch_token=batch_token, index=index)
-        timeline_id = _derive_timeline_id(args.timeline_id, sample_video, index=index)
-        try:
-            report_path = run_smoke_test(
-                args,
-                sample_video,
-                run_id=run_id,
-                timeline_id=timeline_id,
-            )
-        except subprocess.CalledProcessError as exc:
-            if exc.stdout:
-                print(exc.stdout, file=sys.stderr)
-            if exc.stderr:
-                print(exc.stderr, file=sys.stderr)
-            raise
-        print(f"Smoke test completed for {sample_video}. Report written to {report_path}")
+    # Config, storage, and runners are built once; every video shares one workspace.
+    pipeline = _build_pipeline(args, repo_root, run_id=args.run_id or batch_token)
+
+    # Ingest video K+1 on this thread while video K is processed and reported in the
+    # background. At most _MAX_PENDING_VIDEOS manifests wait for processing.
+    pending: deque[tuple[Path, Future[Path]]] = deque()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for index, sample_video in enumerate(videos):
+            timeline_id = _derive_timeline_id(args.timeline_id, sample_video, index=index)
+            if _should_skip_processing(pipeline, args, timeline_id):
+                future = executor.submit(_generate_report, pipeline, args, timeline_id=timeline_id)
+            else:
+                manifest_json = _ingest_sample_video(
+                    pipeline.video_manager,
+                    sample_video,
+                    timeline_id=timeline_id,
+                )
+                future = executor.submit(
+                    _process_and_report,
+                    pipeline,
+                    args,
+                    timeline_id=timeline_id,
+                    manifest_json=manifest_json,
+                )
+            pending.append((sample_video, future))
+            while len(pending) >= _MAX_PENDING_VIDEOS:
+                _report_completion(*pending.popleft())
+
+        while pending:
+            _report_completion(*pending.popleft())
+
+
+def _report_completion(sample_video: Path, future: Future[Path]) -> None:
+    report_path = future.result()
+    print(f"Smoke test completed for {sample_video}. Report written to {report_path}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+import weakref
+from array import array
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Iterable, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+from opencontext.models.context import ProcessedContext
 from opencontext.storage.base_storage import StorageType
 from opencontext.storage.global_storage import get_global_storage
 from opencontext.storage.unified_storage import UnifiedStorage
@@ -14,6 +22,60 @@ from .models import Modality, MultimodalContextItem
 
 logger = get_logger(__name__)
 
+# Every repository shares the document backend's connection, so transactions on it
+# must not interleave across threads (e.g. ingestion workers vs. API readers).
+_CONNECTION_LOCK = threading.RLock()
+
+# Lookup table so row decoding avoids Modality() construction and its ValueError path.
+_MODALITY_BY_VALUE: dict[str, Modality] = {modality.value: modality for modality in Modality}
+
+# Digests bound per embedding-cache lookup, well under SQLite's legacy 999-variable limit.
+_DIGEST_LOOKUP_CHUNK = 500
+
+# Upper bound on concurrent per-context-type vector store upserts.
+_MAX_UPSERT_WORKERS = 4
+
+# Rows per multi-row INSERT, capped so the bound parameters stay below SQLite's legacy
+# 999-variable limit.
+_UPSERT_COLUMN_COUNT = 8
+_UPSERT_ROWS_PER_STATEMENT = min(100, 999 // _UPSERT_COLUMN_COUNT)
+_UPSERT_ROW_PLACEHOLDER = "(?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+
+# Newest segment first; the ORDER BY expression matches idx_glass_multimodal_timeline_segment.
+_FETCH_TIMELINE_TEMPLATE = """
+    SELECT timeline_id, context_id, modality, content_ref, embedding_ready, context_type,
+           segment_start IS NULL AND segment_end IS NULL AS missing_bounds
+    FROM glass_multimodal_context
+    WHERE timeline_id = ?{modality_filter}
+    ORDER BY COALESCE(segment_end, segment_start, 0) DESC, context_id DESC
+"""
+_FETCH_TIMELINE_SQL = _FETCH_TIMELINE_TEMPLATE.format(modality_filter="")
+
+# PRAGMAs applied once per connection; WAL lets timeline readers proceed during ingestion writes.
+_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+# In-memory databases cannot use WAL and have nothing to fsync.
+_MEMORY_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+# Per-thread read-only connections: the read-side subset plus an explicit busy wait, so a
+# reader that races a WAL checkpoint retries instead of failing with "database is locked".
+_READER_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA query_only=1",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
 
 class GlassContextRepository:
     """
@@ -22,6 +84,9 @@ class GlassContextRepository:
     Vector embeddings continue to live in the global storage; this repository only tracks
     timeline metadata in SQLite. The intent is to keep data flow identical for downstream
     consumers while providing a single insertion point for Phase 2.
+
+    Injected connections are tuned (WAL, relaxed sync) on first use, so callers should pass
+    long-lived connections to let WAL checkpoints amortise across upserts.
     """
 
     def __init__(
@@ -30,7 +95,18 @@ class GlassContextRepository:
         connection: Optional[sqlite3.Connection] = None,
     ) -> None:
         self._storage = storage or self._resolve_storage()
+        # Set by _resolve_connection when the backend exposes its database file.
+        self._database_path: Optional[str] = None
+        self._readers = threading.local()
+        # Every read-only connection this repository opened, so close() (or GC) can release them.
+        self._opened_readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        weakref.finalize(self, _close_connections, self._opened_readers)
+        # Dedicated read-only connection for change tokens, so polls never queue on the writer lock.
+        self._version_reader: Optional[sqlite3.Connection] = None
+        self._version_lock = threading.Lock()
         self._connection = connection or self._resolve_connection(self._storage)
+        _apply_connection_pragmas(self._connection)
 
     def upsert_aligned_segments(self, items: Sequence[MultimodalContextItem]) -> List[str]:
         """
@@ -44,103 +120,169 @@ class GlassContextRepository:
             logger.debug("upsert_aligned_segments called with empty payload")
             return []
 
-        # Persist per-context-type batches so we can reliably map returned IDs back to the original items.
-        indexed_by_type: dict[str, list[tuple[int, MultimodalContextItem]]] = defaultdict(list)
-        for index, item in enumerate(items):
+        context_types: list[str] = []
+        for item in items:
             context = item.context
-            if not context or not context.extracted_data or not context.extracted_data.context_type:
+            extracted = context.extracted_data if context else None
+            if not extracted or not extracted.context_type:
                 raise ValueError("Each context item must carry an extracted context_type")
-            context_type_value = context.extracted_data.context_type.value
-            indexed_by_type[context_type_value].append((index, item))
-
-        persisted_ids: list[str | None] = [None] * len(items)
-        for context_type, indexed_items in indexed_by_type.items():
-            contexts = [item.context for _, item in indexed_items]
-            try:
-                upserted_ids = self._storage.batch_upsert_processed_context(contexts) or []
-            except Exception:
-                logger.exception("Failed to persist contexts for type %s", context_type)
-                raise
-
-            if len(upserted_ids) != len(contexts):
-                logger.debug(
-                    "Vector backend returned %s IDs for %s contexts (type=%s); "
-                    "falling back to intrinsic context IDs.",
-                    len(upserted_ids),
-                    len(contexts),
-                    context_type,
-                )
-                upserted_ids = [context.id for context in contexts]
-
-            for (index, item), context_id in zip(indexed_items, upserted_ids):
-                persisted_ids[index] = context_id
-
-        records = []
-        for index, item in enumerate(items):
-            context_id = persisted_ids[index] or item.context.id
-            context_type = None
-            if item.context and item.context.extracted_data:
-                context_type = item.context.extracted_data.context_type.value
-            records.append(
-                {
-                    "timeline_id": item.timeline_id,
-                    "context_id": context_id,
-                    "modality": item.modality.value,
-                    "content_ref": item.content_ref,
-                    "embedding_ready": 1 if item.embedding_ready else 0,
-                    "context_type": context_type,
-                }
-            )
+            context_types.append(extracted.context_type.value)
 
+        # Persist per-context-type batches so we can reliably map returned IDs back to the original items.
+        batches: list[tuple[str, list[tuple[int, MultimodalContextItem]]]]
+        if len(set(context_types)) == 1:
+            # Common case: the whole batch shares one context_type, so skip partitioning.
+            batches = [(context_types[0], list(enumerate(items)))]
+        else:
+            indexed_by_type: dict[str, list[tuple[int, MultimodalContextItem]]] = defaultdict(list)
+            for index, (item, context_type) in enumerate(zip(items, context_types)):
+                indexed_by_type[context_type].append((index, item))
+            batches = list(indexed_by_type.items())
+
+        if len(batches) > 1:
+            # Per-type batches are independent vector-store round trips; overlap their latency.
+            with ThreadPoolExecutor(max_workers=min(_MAX_UPSERT_WORKERS, len(batches))) as executor:
+                batch_ids = list(executor.map(lambda batch: self._upsert_contexts(*batch), batches))
+        else:
+            batch_ids = [self._upsert_contexts(*batch) for batch in batches]
+
+        # Only the returned IDs are kept for the whole batch; SQLite records are generated lazily
+        # and materialised one INSERT chunk at a time.
+        persisted_ids: list[str] = [""] * len(items)
+        records = _iter_upsert_records(batches, batch_ids, persisted_ids)
         with self._transaction() as cursor:
-            cursor.executemany(
-                """
-                INSERT INTO glass_multimodal_context (
-                    timeline_id,
-                    context_id,
-                    modality,
-                    content_ref,
-                    embedding_ready,
-                    context_type,
-                    created_at,
-                    updated_at
+            while True:
+                chunk = list(islice(records, _UPSERT_ROWS_PER_STATEMENT))
+                if len(chunk) < _UPSERT_ROWS_PER_STATEMENT:
+                    # Short tail: reuse the single-row statement so only two upsert shapes
+                    # ever occupy the statement cache.
+                    cursor.executemany(_multirow_upsert_sql(1), chunk)
+                    break
+                cursor.execute(
+                    _multirow_upsert_sql(len(chunk)),
+                    [value for record in chunk for value in record],
                 )
-                VALUES (
-                    :timeline_id,
-                    :context_id,
-                    :modality,
-                    :content_ref,
-                    :embedding_ready,
-                    :context_type,
-                    CURRENT_TIMESTAMP,
-                    CURRENT_TIMESTAMP
-                )
-                ON CONFLICT(context_id) DO UPDATE SET
-                    timeline_id = excluded.timeline_id,
-                    modality = excluded.modality,
-                    content_ref = excluded.content_ref,
-                    embedding_ready = excluded.embedding_ready,
-                    context_type = excluded.context_type,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                records,
+
+        return persisted_ids
+
+    def _upsert_contexts(
+        self,
+        context_type: str,
+        indexed_items: Sequence[tuple[int, MultimodalContextItem]],
+    ) -> List[str]:
+        contexts = [item.context for _, item in indexed_items]
+        try:
+            upserted_ids = self._storage.batch_upsert_processed_context(contexts) or []
+        except Exception:
+            logger.exception("Failed to persist contexts for type %s", context_type)
+            raise
+
+        if len(upserted_ids) != len(contexts):
+            logger.debug(
+                "Vector backend returned %s IDs for %s contexts (type=%s); "
+                "falling back to intrinsic context IDs.",
+                len(upserted_ids),
+                len(contexts),
+                context_type,
             )
+            upserted_ids = [context.id for context in contexts]
+        return upserted_ids
 
-        return [persisted_id or item.context.id for persisted_id, item in zip(persisted_ids, items)]
+    def close(self) -> None:
+        """
+        Close the read-only connections opened by this repository.
+
+        The shared writer connection belongs to the storage backend (or the caller) and stays
+        open. Readers reopen lazily, so the repository remains usable afterwards; call this at
+        shutdown, not while other threads are mid-read.
+        """
+        with self._readers_lock:
+            self._readers = threading.local()
+        with self._version_lock:
+            self._version_reader = None
+        _close_connections(self._opened_readers)
 
-    def fetch_by_timeline(self, timeline_id: str) -> List[sqlite3.Row]:
+    def data_version(self) -> Tuple[int, int]:
+        """
+        Cheap change token for cached reads.
+
+        For file databases this is PRAGMA data_version on a dedicated read-only connection:
+        every write commits through another connection, so any commit moves it, and the poll
+        never waits on an in-flight write transaction. Injected or in-memory connections have
+        no separate reader, so the token combines the shared connection's total_changes with
+        its data_version under the connection lock.
+        """
+        if self._database_path is not None:
+            with self._version_lock:
+                if self._version_reader is None:
+                    self._version_reader = self._open_reader()
+                (data_version,) = self._version_reader.execute("PRAGMA data_version").fetchone()
+            return 0, data_version
+
+        with _CONNECTION_LOCK:
+            (data_version,) = self._connection.execute("PRAGMA data_version").fetchone()
+            return self._connection.total_changes, data_version
+
+    def fetch_by_timeline(
+        self,
+        timeline_id: str,
+        modalities: Sequence[Modality] | None = None,
+    ) -> List[sqlite3.Row]:
         """Fetch raw rows for a timeline. Primarily intended for validation and tests."""
         with self._transaction(readonly=True) as cursor:
-            cursor.execute(
+            cursor.execute(*_timeline_query(timeline_id, modalities))
+            return cursor.fetchall()
+
+    def _fetch_timeline_tuples(
+        self,
+        timeline_id: str,
+        modalities: Sequence[Modality] | None = None,
+    ) -> List[tuple]:
+        """Fetch timeline rows as plain tuples, skipping sqlite3.Row name lookups on hot paths."""
+        with self._transaction(readonly=True) as cursor:
+            cursor.row_factory = None
+            cursor.execute(*_timeline_query(timeline_id, modalities))
+            return cursor.fetchall()
+
+    def fetch_cached_embeddings(self, digests: Sequence[str], model: str) -> dict[str, List[float]]:
+        """Return frame embeddings cached for ``model`` keyed by content digest; misses are simply absent."""
+        unique_digests = list(dict.fromkeys(digests))
+        cached: dict[str, List[float]] = {}
+        with self._transaction(readonly=True) as cursor:
+            cursor.row_factory = None
+            for offset in range(0, len(unique_digests), _DIGEST_LOOKUP_CHUNK):
+                chunk = unique_digests[offset : offset + _DIGEST_LOOKUP_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    "SELECT content_digest, vector, dim FROM glass_embedding_cache "
+                    f"WHERE model = ? AND content_digest IN ({placeholders})",
+                    (model, *chunk),
+                )
+                for digest, blob, dim in cursor.fetchall():
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    if len(vector) == dim:
+                        cached[digest] = vector.tolist()
+        return cached
+
+    def store_cached_embeddings(self, vectors: Mapping[str, Sequence[float]], model: str) -> None:
+        """Persist ``model`` frame embeddings keyed by content digest as packed float32 blobs."""
+        rows = [
+            (digest, model, array("f", vector).tobytes(), len(vector))
+            for digest, vector in vectors.items()
+            if vector
+        ]
+        if not rows:
+            return
+        with self._transaction() as cursor:
+            cursor.executemany(
                 """
-                SELECT timeline_id, context_id, modality, content_ref, embedding_ready, context_type
-                FROM glass_multimodal_context
-                WHERE timeline_id = ?
-                ORDER BY context_id
+                INSERT INTO glass_embedding_cache (content_digest, model, vector, dim)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(content_digest, model) DO NOTHING
                 """,
-                (timeline_id,),
+                rows,
             )
-            return cursor.fetchall()
 
     def load_envelope(
         self,
@@ -154,68 +296,141 @@ class GlassContextRepository:
         Returns None when no multimodal items are recorded or when the underlying
         ProcessedContext records cannot be reconstructed.
         """
-        rows = self.fetch_by_timeline(timeline_id)
+        rows = self._fetch_timeline_tuples(timeline_id, modalities)
         if not rows:
             return None
 
-        allowed_modalities = {modality for modality in modalities} if modalities else None
-        items: List[MultimodalContextItem] = []
-        for row in rows:
-            try:
-                modality = Modality(row["modality"])
-            except ValueError:
+        pending: List[Tuple[str, str, Modality, str, bool]] = []
+        ids_by_type: dict[str, list[str]] = defaultdict(list)
+        # Rows written before the segment columns existed carry no bounds until
+        # backfill_segment_bounds() runs, so SQL cannot order them.
+        has_unbounded = False
+        for _, context_id, modality_value, content_ref, embedding_ready, context_type, missing in rows:
+            modality = _MODALITY_BY_VALUE.get(modality_value)
+            if modality is None:
                 logger.debug(
                     "Skipping multimodal row with unsupported modality '%s' for timeline %s",
-                    row["modality"],
+                    modality_value,
                     timeline_id,
                 )
                 continue
 
-            if allowed_modalities and modality not in allowed_modalities:
-                continue
-
-            context_type = row["context_type"]
             if not context_type:
                 logger.debug(
                     "Multimodal row %s for timeline %s missing context_type metadata",
-                    row["context_id"],
+                    context_id,
                     timeline_id,
                 )
                 continue
 
-            context = self._storage.get_processed_context(row["context_id"], context_type)
+            pending.append((context_id, context_type, modality, content_ref, bool(embedding_ready)))
+            ids_by_type[context_type].append(context_id)
+            has_unbounded = has_unbounded or bool(missing)
+
+        contexts_by_key = self._fetch_processed_contexts(ids_by_type)
+        items: List[MultimodalContextItem] = []
+        source: Optional[str] = None
+        for context_id, context_type, modality, content_ref, embedding_ready in pending:
+            context = contexts_by_key.get((context_type, context_id))
             if not context:
                 logger.debug(
                     "Processed context %s (%s) not found for timeline %s",
-                    row["context_id"],
+                    context_id,
                     context_type,
                     timeline_id,
                 )
                 continue
 
+            if source is None:
+                source_video = (context.metadata or {}).get("source_video")
+                if source_video:
+                    source = str(source_video)
+
             item = MultimodalContextItem(
                 context=context,
                 timeline_id=timeline_id,
                 modality=modality,
-                content_ref=row["content_ref"],
-                embedding_ready=bool(row["embedding_ready"]),
+                content_ref=content_ref,
+                embedding_ready=embedding_ready,
             )
             items.append(item)
 
         if not items:
             return None
 
-        items.sort(key=_sort_envelope_item, reverse=True)
-        source = _resolve_source_from_items(items) or timeline_id
-
-        from glass.processing.envelope import ContextEnvelope  # local import to avoid cycle
-
-        return ContextEnvelope.from_items(
+        if has_unbounded:
+            items.sort(key=_segment_sort_key, reverse=True)
+        # Otherwise rows already arrive newest-segment-first from fetch_by_timeline.
+        return _envelope_cls().from_items(
             timeline_id=timeline_id,
-            source=source,
+            source=source or timeline_id,
             items=items,
         )
 
+    def backfill_segment_bounds(self) -> int:
+        """
+        Copy segment bounds from context metadata onto rows that predate the segment columns.
+
+        A one-off maintenance step: the bounds live in the processed-context store, so the
+        SQLite schema migration cannot fill them in itself. Returns the number of rows updated.
+        """
+        with self._transaction(readonly=True) as cursor:
+            cursor.row_factory = None
+            cursor.execute(
+                """
+                SELECT context_id, context_type FROM glass_multimodal_context
+                WHERE segment_start IS NULL AND segment_end IS NULL AND context_type IS NOT NULL
+                """
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            return 0
+
+        ids_by_type: dict[str, list[str]] = defaultdict(list)
+        for context_id, context_type in rows:
+            ids_by_type[context_type].append(context_id)
+        params = []
+        for context in self._fetch_processed_contexts(ids_by_type).values():
+            metadata = context.metadata or {}
+            start = _segment_bound(metadata.get("segment_start"))
+            end = _segment_bound(metadata.get("segment_end"))
+            if start is not None or end is not None:
+                params.append((start, end, context.id))
+        if not params:
+            return 0
+
+        with self._transaction() as cursor:
+            cursor.executemany(
+                """
+                UPDATE glass_multimodal_context
+                SET segment_start = ?, segment_end = ?
+                WHERE context_id = ? AND segment_start IS NULL AND segment_end IS NULL
+                """,
+                params,
+            )
+        logger.info("Backfilled segment bounds for %s Glass rows", len(params))
+        return len(params)
+
+    def _fetch_processed_contexts(
+        self,
+        ids_by_type: dict[str, list[str]],
+    ) -> dict[Tuple[str, str], ProcessedContext]:
+        """Fetch ProcessedContexts with one backend lookup per context type when supported."""
+        batch_get = getattr(self._storage, "batch_get_processed_context", None)
+        contexts: dict[Tuple[str, str], ProcessedContext] = {}
+        for context_type, context_ids in ids_by_type.items():
+            if batch_get is not None:
+                fetched = batch_get(context_ids, context_type) or []
+            else:
+                fetched = [
+                    self._storage.get_processed_context(context_id, context_type)
+                    for context_id in context_ids
+                ]
+            for context in fetched:
+                if context:
+                    contexts[(context_type, context.id)] = context
+        return contexts
+
     def _resolve_storage(self) -> UnifiedStorage:
         storage = get_global_storage().get_storage()
         if not storage:
@@ -233,44 +448,201 @@ class GlassContextRepository:
 
         # Ensure we surface rows as dictionaries for convenience.
         connection.row_factory = sqlite3.Row
+        db_path = getattr(backend, "db_path", None)
+        if db_path and db_path != ":memory:":
+            self._database_path = str(db_path)
         return connection
 
+    def _reader_connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Return this thread's read-only connection, opening it on first use.
+
+        Under WAL, readers on their own connections do not queue behind the shared writer
+        connection. Returns None when the database file is unknown (e.g. injected connections).
+        """
+        if self._database_path is None:
+            return None
+
+        reader = getattr(self._readers, "connection", None)
+        if reader is None:
+            reader = self._open_reader()
+            self._readers.connection = reader
+        return reader
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"{Path(self._database_path).resolve().as_uri()}?mode=ro"
+        reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        reader.row_factory = sqlite3.Row
+        for pragma in _READER_CONNECTION_PRAGMAS:
+            reader.execute(pragma)
+        with self._readers_lock:
+            self._opened_readers.append(reader)
+        return reader
+
     @contextmanager
     def _transaction(self, readonly: bool = False) -> Iterable[sqlite3.Cursor]:
-        cursor = self._connection.cursor()
+        reader = self._reader_connection() if readonly else None
+        if reader is not None:
+            cursor = reader.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+
+        with _CONNECTION_LOCK:
+            cursor = self._connection.cursor()
+            if not readonly and self._connection.in_transaction:
+                # A caller already owns a transaction; nest inside it so we neither commit nor
+                # roll back their work.
+                yield from self._savepoint(cursor)
+                return
+
+            if not readonly:
+                # Take the write lock up front so the whole batch shares one journal commit.
+                cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                if not readonly:
+                    self._connection.commit()
+            except Exception:
+                logger.exception("SQLite operation failed; rolling back transaction")
+                if not readonly:
+                    self._connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def _savepoint(self, cursor: sqlite3.Cursor) -> Iterator[sqlite3.Cursor]:
+        cursor.execute("SAVEPOINT glass_repository")
         try:
             yield cursor
-            if not readonly:
-                self._connection.commit()
+            cursor.execute("RELEASE SAVEPOINT glass_repository")
         except Exception:
-            logger.exception("SQLite operation failed; rolling back transaction")
-            if not readonly:
-                self._connection.rollback()
+            logger.exception("SQLite operation failed; rolling back to savepoint")
+            cursor.execute("ROLLBACK TO SAVEPOINT glass_repository")
+            cursor.execute("RELEASE SAVEPOINT glass_repository")
             raise
         finally:
             cursor.close()
 
 
-def _sort_envelope_item(item: MultimodalContextItem) -> Tuple[float, float]:
-    """
-    Sort envelope items by segment_end (fallback to segment_start) and creation time.
+@lru_cache(maxsize=None)
+def _envelope_cls():
+    from glass.processing.envelope import ContextEnvelope  # local import to avoid cycle
+
+    return ContextEnvelope
+
+
+def _iter_upsert_records(
+    batches: Sequence[tuple[str, Sequence[tuple[int, MultimodalContextItem]]]],
+    batch_ids: Sequence[Sequence[str]],
+    persisted_ids: List[str],
+) -> Iterator[tuple[object, ...]]:
+    """Yield positional upsert rows, recording each persisted ID at its item's original index."""
+    for (context_type, indexed_items), upserted_ids in zip(batches, batch_ids):
+        for (index, item), context_id in zip(indexed_items, upserted_ids):
+            context_id = context_id or item.context.id
+            persisted_ids[index] = context_id
+            metadata = item.context.metadata or {}
+            yield (
+                item.timeline_id,
+                context_id,
+                item.modality.value,
+                item.content_ref,
+                1 if item.embedding_ready else 0,
+                context_type,
+                _segment_bound(metadata.get("segment_start")),
+                _segment_bound(metadata.get("segment_end")),
+            )
 
-    Returns a tuple so that Python can compare consistently even when metadata is missing.
+
+def _timeline_query(
+    timeline_id: str,
+    modalities: Sequence[Modality] | None,
+) -> Tuple[str, Tuple[str, ...]]:
+    if not modalities:
+        return _FETCH_TIMELINE_SQL, (timeline_id,)
+    values = tuple(dict.fromkeys(modality.value for modality in modalities))
+    return _filtered_timeline_sql(len(values)), (timeline_id, *values)
+
+
+@lru_cache(maxsize=None)
+def _filtered_timeline_sql(modality_count: int) -> str:
+    placeholders = ", ".join("?" * modality_count)
+    return _FETCH_TIMELINE_TEMPLATE.format(modality_filter=f" AND modality IN ({placeholders})")
+
+
+@lru_cache(maxsize=None)
+def _multirow_upsert_sql(row_count: int) -> str:
+    values = ",\n".join([_UPSERT_ROW_PLACEHOLDER] * row_count)
+    return f"""
+        INSERT INTO glass_multimodal_context (
+            timeline_id,
+            context_id,
+            modality,
+            content_ref,
+            embedding_ready,
+            context_type,
+            segment_start,
+            segment_end,
+            created_at,
+            updated_at
+        )
+        VALUES {values}
+        ON CONFLICT(context_id) DO UPDATE SET
+            timeline_id = excluded.timeline_id,
+            modality = excluded.modality,
+            content_ref = excluded.content_ref,
+            embedding_ready = excluded.embedding_ready,
+            context_type = excluded.context_type,
+            segment_start = excluded.segment_start,
+            segment_end = excluded.segment_end,
+            updated_at = CURRENT_TIMESTAMP
     """
+
+
+def _apply_connection_pragmas(connection: sqlite3.Connection) -> None:
+    # Applied on every resolution: the PRAGMAs are idempotent and cheap, and inferring "already
+    # tuned" from one setting would skip connections a caller opened with that value themselves.
+    with _CONNECTION_LOCK:
+        in_memory = _is_memory_database(connection)
+        if connection.in_transaction:
+            # journal_mode cannot change mid-transaction; retry on the next resolution.
+            logger.debug("Deferring SQLite PRAGMA tuning while a transaction is open")
+            return
+        for pragma in _MEMORY_CONNECTION_PRAGMAS if in_memory else _CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+
+
+def _is_memory_database(connection: sqlite3.Connection) -> bool:
+    for _, name, file in connection.execute("PRAGMA database_list").fetchall():
+        if name == "main":
+            return not file
+    return False
+
+
+def _close_connections(connections: List[sqlite3.Connection]) -> None:
+    while connections:
+        try:
+            connections.pop().close()
+        except sqlite3.Error:
+            pass
+
+
+def _segment_sort_key(item: MultimodalContextItem) -> Tuple[float, str]:
+    """Python mirror of the SQL ORDER BY, reading bounds from the context metadata."""
     metadata = item.context.metadata or {}
-    segment_end = metadata.get("segment_end")
-    segment_start = metadata.get("segment_start")
-
-    end_val = float(segment_end) if segment_end is not None else float(segment_start or 0.0)
-    create_time = item.context.properties.create_time
-    create_ts = create_time.timestamp() if create_time else 0.0
-    return end_val, create_ts
-
-
-def _resolve_source_from_items(items: Sequence[MultimodalContextItem]) -> Optional[str]:
-    for item in items:
-        metadata = item.context.metadata or {}
-        source = metadata.get("source_video")
-        if source:
-            return str(source)
-    return None
+    end = _segment_bound(metadata.get("segment_end"))
+    if end is None:
+        end = _segment_bound(metadata.get("segment_start"))
+    return (end if end is not None else 0.0), item.context.id
+
+
+def _segment_bound(value: object) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
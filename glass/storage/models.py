@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass
 from enum import Enum
 
-from pydantic import BaseModel, Field
-
 from opencontext.models.context import ProcessedContext
 
+# ``slots=True`` is only accepted by dataclass() from Python 3.10 onwards.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class Modality(str, Enum):
     """Supported modalities for multimodal context items."""
@@ -16,30 +19,29 @@ class Modality(str, Enum):
     TEXT = "text"
 
 
-class MultimodalContextItem(BaseModel):
+@dataclass(**_SLOTS)
+class MultimodalContextItem:
     """
     Lightweight wrapper that keeps a ProcessedContext aligned with its multimodal origin.
 
     The MineContext data pipeline continues to operate on ProcessedContext objects. Glass
     extends it with timeline-aware metadata so we can keep track of the original segment
     without adding new branches downstream.
+
+    Items are built in bulk by the chunker from already-validated manifests, so this is a
+    plain (slotted) dataclass rather than a validating model.
+
+    Attributes:
+        context: ProcessedContext payload persisted in the vector backend.
+        timeline_id: Timeline identifier produced during ingestion.
+        modality: Modal channel this context item represents (audio, frame, etc.).
+        content_ref: Reference to the raw artefact (path to frame, inline transcript token, etc.).
+        embedding_ready: Whether the context payload has been vectorised and stored in the
+            vector backend.
     """
 
     context: ProcessedContext
-    timeline_id: str = Field(..., description="Timeline identifier produced during ingestion.")
-    modality: Modality = Field(
-        ..., description="Modal channel this context item represents (audio, frame, etc.)."
-    )
-    content_ref: str = Field(
-        ...,
-        description=(
-            "Reference to the raw artefact (path to frame, inline transcript token, etc.)."
-        ),
-    )
-    embedding_ready: bool = Field(
-        False,
-        description=(
-            "Flag indicating whether the context payload has been vectorised and stored in "
-            "the vector backend."
-        ),
-    )
+    timeline_id: str
+    modality: Modality
+    content_ref: str
+    embedding_ready: bool = False
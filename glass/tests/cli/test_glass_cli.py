@@ -37,6 +37,7 @@ def test_resolve_report_window_fallback_lookback(monkeypatch) -> None:
             return datetime.datetime.fromisoformat(value)
 
     monkeypatch.setattr(cli, "datetime", _FixedDatetime)
+    monkeypatch.setattr(cli.time, "time", lambda: reference.timestamp())
 
     args = _make_namespace(start=None, end=None, lookback_minutes=30)
     start_ts, end_ts = cli._resolve_report_window(args)
@@ -45,6 +46,28 @@ def test_resolve_report_window_fallback_lookback(monkeypatch) -> None:
     assert end_ts - start_ts == 30 * 60
 
 
+def test_resolve_report_window_start_only_ends_now(monkeypatch) -> None:
+    reference = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+    class _FixedDatetime:
+        @staticmethod
+        def now(tz=None):  # noqa: D401 - mimic datetime.now
+            return reference if tz else reference.replace(tzinfo=None)
+
+        @staticmethod
+        def fromisoformat(value: str):
+            return datetime.datetime.fromisoformat(value)
+
+    monkeypatch.setattr(cli, "datetime", _FixedDatetime)
+
+    start = reference - datetime.timedelta(minutes=45)
+    args = _make_namespace(start=start.isoformat(), end=None, lookback_minutes=30)
+    start_ts, end_ts = cli._resolve_report_window(args)
+
+    assert start_ts == int(start.timestamp())
+    assert end_ts == int(reference.timestamp())
+
+
 def test_render_daily_report(tmp_path) -> None:
     timeline_id = "25-01-foo-01-video"
     report_file = tmp_path / f"{timeline_id}.md"
@@ -1,8 +1,9 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from glass.commands import discover_date_videos
+from glass.commands import discover_date_videos, start
 
 
 def test_discover_date_videos_filters_extensions(tmp_path) -> None:
@@ -25,3 +26,52 @@ def test_discover_date_videos_raises_when_empty(tmp_path) -> None:
 
     with pytest.raises(FileNotFoundError):
         discover_date_videos(empty_dir)
+
+
+def test_discover_date_videos_skips_hidden_directories(tmp_path) -> None:
+    (tmp_path / "clip.MP4").write_bytes(b"fake")
+    hidden = tmp_path / ".thumbnails"
+    hidden.mkdir()
+    (hidden / "cached.mp4").write_bytes(b"fake")
+
+    videos = discover_date_videos(tmp_path)
+
+    assert videos == [tmp_path / "clip.MP4"]
+
+
+def test_discover_date_videos_notices_new_nested_files(tmp_path) -> None:
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (nested / "clip_a.mp4").write_bytes(b"fake")
+    assert [path.name for path in discover_date_videos(tmp_path)] == ["clip_a.mp4"]
+
+    # Written within the same timestamp tick as the first walk, which therefore was not cached.
+    (nested / "clip_b.mp4").write_bytes(b"fake")
+
+    assert [path.name for path in discover_date_videos(tmp_path)] == ["clip_a.mp4", "clip_b.mp4"]
+
+
+def test_discover_date_videos_reuses_walk_of_settled_directories(tmp_path, monkeypatch) -> None:
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (nested / "clip_a.mp4").write_bytes(b"fake")
+    for directory in (nested, tmp_path):
+        os.utime(directory, ns=(0, 1_000_000_000))
+
+    walks: list[Path] = []
+    original = start._iter_video_files
+
+    def _counting_walk(root, walked_dirs=None):
+        walks.append(root)
+        return original(root, walked_dirs)
+
+    monkeypatch.setattr(start, "_iter_video_files", _counting_walk)
+
+    assert [path.name for path in discover_date_videos(tmp_path)] == ["clip_a.mp4"]
+    assert [path.name for path in discover_date_videos(tmp_path)] == ["clip_a.mp4"]
+    assert len(walks) == 1
+
+    (nested / "clip_b.mp4").write_bytes(b"fake")
+
+    assert [path.name for path in discover_date_videos(tmp_path)] == ["clip_a.mp4", "clip_b.mp4"]
+    assert len(walks) == 2
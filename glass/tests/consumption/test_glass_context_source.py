@@ -27,6 +27,8 @@ def _bootstrap_schema(connection: sqlite3.Connection) -> None:
             content_ref TEXT NOT NULL,
             embedding_ready BOOLEAN DEFAULT 0,
             context_type TEXT,
+            segment_start REAL,
+            segment_end REAL,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
         )
@@ -188,3 +190,95 @@ def test_group_by_context_type_uses_timeline_ordering() -> None:
     ordered_ids = [context.id for context in grouped[ContextType.ACTIVITY_CONTEXT.value]]
     # Should be sorted from latest to earliest
     assert ordered_ids == [contexts[1].id, contexts[0].id]
+
+
+def test_context_strings_are_cached_until_context_updates(monkeypatch) -> None:
+    connection = sqlite3.connect(":memory:")
+    repo = _make_repo(connection)
+    base_time = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+    context = _make_context(
+        text="cached",
+        context_type=ContextType.ACTIVITY_CONTEXT,
+        metadata={"segment_start": 0.0, "segment_end": 1.0},
+        create_time=base_time,
+    )
+    item = MultimodalContextItem(
+        context=context,
+        timeline_id="timeline-cache",
+        modality=Modality.AUDIO,
+        content_ref="a.txt",
+    )
+    repo.upsert_aligned_segments([item])
+
+    renders: list[str] = []
+    original = ProcessedContext.get_llm_context_string
+
+    def _counting_render(self: ProcessedContext) -> str:
+        renders.append(self.id)
+        return original(self)
+
+    monkeypatch.setattr(ProcessedContext, "get_llm_context_string", _counting_render)
+
+    source = GlassContextSource(repository=repo)
+    first = source.get_context_strings("timeline-cache")
+    second = source.get_context_strings("timeline-cache")
+    assert first == second
+    assert renders == [context.id]
+
+    context.properties.update_time = base_time + datetime.timedelta(minutes=5)
+    context.metadata["segment_end"] = 2.0
+    repo.upsert_aligned_segments([item])
+
+    refreshed = source.get_context_strings("timeline-cache")
+    assert renders == [context.id, context.id]
+    assert "\"segment_end\": 2.0" in refreshed[0]
+
+
+def test_envelope_is_reused_until_repository_changes(monkeypatch) -> None:
+    connection = sqlite3.connect(":memory:")
+    repo = _make_repo(connection)
+    base_time = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def _item(text: str, end: float) -> MultimodalContextItem:
+        return MultimodalContextItem(
+            context=_make_context(
+                text=text,
+                context_type=ContextType.ACTIVITY_CONTEXT,
+                metadata={"segment_start": end - 1, "segment_end": end},
+                create_time=base_time,
+            ),
+            timeline_id="timeline-envelope-cache",
+            modality=Modality.AUDIO,
+            content_ref=f"{text}.txt",
+        )
+
+    repo.upsert_aligned_segments([_item("first", 1.0)])
+
+    loads: list[str] = []
+    original = GlassContextRepository.load_envelope
+
+    def _counting_load(self, timeline_id, **kwargs):
+        loads.append(timeline_id)
+        return original(self, timeline_id, **kwargs)
+
+    monkeypatch.setattr(GlassContextRepository, "load_envelope", _counting_load)
+
+    source = GlassContextSource(repository=repo)
+    assert len(source.get_processed_contexts("timeline-envelope-cache")) == 1
+    source.group_by_context_type("timeline-envelope-cache")
+    assert loads == ["timeline-envelope-cache"]
+
+    repo.upsert_aligned_segments([_item("second", 2.0)])
+    assert len(source.get_processed_contexts("timeline-envelope-cache")) == 2
+    assert loads == ["timeline-envelope-cache", "timeline-envelope-cache"]
+
+    # Callers get their own envelope; reordering it must not leak into the cache.
+    envelope = source.fetch_envelope("timeline-envelope-cache")
+    envelope.items.reverse()
+    envelope.items[0].content_ref = "mutated.txt"
+    assert [item.content_ref for item in source.get_items("timeline-envelope-cache")] == [
+        "second.txt",
+        "first.txt",
+    ]
+    assert len(loads) == 2
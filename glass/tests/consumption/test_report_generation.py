@@ -29,6 +29,8 @@ def _bootstrap_schema(connection: sqlite3.Connection) -> None:
             content_ref TEXT NOT NULL,
             embedding_ready BOOLEAN DEFAULT 0,
             context_type TEXT,
+            segment_start REAL,
+            segment_end REAL,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
         )
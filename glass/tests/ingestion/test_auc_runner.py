@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import base64
+import json
 import wave
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from glass.ingestion import auc_runner
 from glass.ingestion.auc_runner import AUCTurboConfig, AUCTurboRunner
 from glass.ingestion.models import SegmentType
 
@@ -48,6 +51,33 @@ def test_auc_runner_transcribe_success(tmp_path: Path) -> None:
     mock_session.post.assert_called_once()
 
 
+def test_auc_runner_posts_audio_as_base64_json_body(tmp_path: Path, monkeypatch) -> None:
+    audio_path = tmp_path / "sample.wav"
+    _write_silence_wav(audio_path, duration=1.0)
+    # Force several encode chunks so their concatenation is exercised.
+    monkeypatch.setattr(auc_runner, "_BASE64_READ_CHUNK", 3 * 1024)
+
+    mock_session = mock.Mock()
+    mock_response = mock.Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {"X-Api-Status-Code": "20000000"}
+    mock_response.json.return_value = {
+        "result": {"utterances": [{"start_time": 0, "end_time": 1.0, "text": "hi"}]}
+    }
+    mock_session.post.return_value = mock_response
+
+    runner = AUCTurboRunner(
+        config=AUCTurboConfig(app_key="app", access_key="key", model_name="bigmodel"),
+        session=mock_session,
+    )
+    runner.transcribe(audio_path, timeline_id="abc123")
+
+    body = json.loads(mock_session.post.call_args.kwargs["data"])
+    assert body["user"] == {"uid": "app"}
+    assert body["request"] == {"model_name": "bigmodel"}
+    assert base64.b64decode(body["audio"]["data"]) == audio_path.read_bytes()
+
+
 def test_auc_runner_rejects_large_file(tmp_path: Path) -> None:
     audio_path = tmp_path / "oversize.wav"
     audio_path.write_bytes(b"x" * 1024 * 1024)  # 1 MB
@@ -62,3 +92,14 @@ def test_auc_runner_rejects_large_file(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError):
         runner.transcribe(audio_path, timeline_id="oversize")
+
+
+def test_auc_runner_default_session_pools_and_retries() -> None:
+    config = AUCTurboConfig(app_key="app", access_key="secret")
+    runner = AUCTurboRunner(config)
+
+    adapter = runner._session.get_adapter(config.build_url())
+
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "POST" in adapter.max_retries.allowed_methods
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from glass.ingestion.hashing import compute_file_digest
+
+
+def test_compute_file_digest_matches_blake2b(tmp_path: Path) -> None:
+    payload = b"glass" * 200_000  # spans several read chunks
+    path = tmp_path / "clip.bin"
+    path.write_bytes(payload)
+
+    assert compute_file_digest(path) == hashlib.blake2b(payload, digest_size=32).hexdigest()
+    assert compute_file_digest(path, digest_size=16) == hashlib.blake2b(
+        payload, digest_size=16
+    ).hexdigest()
+
+
+def test_compute_file_digest_without_file_digest(tmp_path: Path, monkeypatch) -> None:
+    payload = b"frame" * 100_000
+    path = tmp_path / "frame.png"
+    path.write_bytes(payload)
+
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+    assert compute_file_digest(path) == hashlib.blake2b(payload, digest_size=32).hexdigest()
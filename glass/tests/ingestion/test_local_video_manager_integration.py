@@ -6,6 +6,8 @@ import pytest
 
 from glass.ingestion import (
     AlignmentSegment,
+    AudioExtractionResult,
+    FrameExtractionResult,
     IngestionStatus,
     LocalVideoManager,
     SegmentType,
@@ -48,3 +50,67 @@ def test_local_video_manager_runs_pipeline(tmp_path: Path) -> None:
 
     fetched_manifest = manager.fetch_manifest(manifest.timeline_id)
     assert fetched_manifest.timeline_id == manifest.timeline_id
+
+
+class _CountingFFmpegRunner:
+    def __init__(self) -> None:
+        self.frame_calls = 0
+
+    def extract_frames(self, video_path: Path, *, fps: float, output_dir: Path) -> FrameExtractionResult:
+        self.frame_calls += 1
+        output_dir.mkdir(parents=True, exist_ok=True)
+        frame_path = output_dir / "frame_00001.png"
+        frame_path.write_bytes(b"fake-frame")
+        return FrameExtractionResult(frames_dir=output_dir, frame_paths=[frame_path])
+
+    def extract_audio(self, video_path: Path, *, output_path: Path) -> AudioExtractionResult:
+        output_path.write_bytes(b"fake-audio")
+        return AudioExtractionResult(audio_path=output_path)
+
+
+def test_local_video_manager_reuses_manifest_for_identical_video(tmp_path: Path) -> None:
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"same-bytes" * 1024)
+    ffmpeg = _CountingFFmpegRunner()
+    manager = LocalVideoManager(
+        base_dir=tmp_path / "glass",
+        ffmpeg_runner=ffmpeg,
+        speech_runner=_StubSpeechRunner(),
+    )
+
+    first = manager.ingest(video, timeline_id="timeline-a")
+    second = manager.ingest(video, timeline_id="timeline-b")
+
+    assert ffmpeg.frame_calls == 1
+    assert second.timeline_id == "timeline-b"
+    timeline_b = tmp_path / "glass" / "timeline-b"
+    assert second.source == str(timeline_b / "clip.mp4")
+    frame_payloads = [segment.payload for segment in second.segments if segment.type is SegmentType.FRAME]
+    assert frame_payloads == [str(timeline_b / "frames" / "frame_00001.png")]
+    assert [segment for segment in second.segments if segment.type is SegmentType.AUDIO] == [
+        segment for segment in first.segments if segment.type is SegmentType.AUDIO
+    ]
+    for name in ("clip.mp4", "audio.wav", "transcription_raw.json", "frames/frame_00001.png"):
+        assert (timeline_b / name).read_bytes() == (tmp_path / "glass" / "timeline-a" / name).read_bytes()
+    assert manager.get_status("timeline-b") is IngestionStatus.COMPLETED
+    assert manager.fetch_manifest("timeline-b").timeline_id == "timeline-b"
+
+
+def test_local_video_manager_detects_changes_inside_large_videos(tmp_path: Path) -> None:
+    payload = bytearray(b"\x00" * (3 * 1024 * 1024))
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(payload)
+    ffmpeg = _CountingFFmpegRunner()
+    manager = LocalVideoManager(
+        base_dir=tmp_path / "glass",
+        ffmpeg_runner=ffmpeg,
+        speech_runner=_StubSpeechRunner(),
+    )
+    manager.ingest(video, timeline_id="timeline-a")
+
+    # Same size, head, and tail; only a byte in the middle differs.
+    payload[len(payload) // 2] = 1
+    video.write_bytes(payload)
+    manager.ingest(video, timeline_id="timeline-b")
+
+    assert ffmpeg.frame_calls == 2
@@ -41,6 +41,23 @@ def test_alignment_manifest_sorts_segments() -> None:
     assert starts == [0.0, 10.0]
 
 
+def test_alignment_manifest_iter_segments_filters_by_type_in_order() -> None:
+    manifest = AlignmentManifest(
+        timeline_id="timeline-456",
+        source="sample.mp4",
+        segments=[
+            AlignmentSegment(start=4.0, end=5.0, type=SegmentType.FRAME, payload="frame_0003.png"),
+            AlignmentSegment(start=0.0, end=3.0, type=SegmentType.AUDIO, payload="hello"),
+            AlignmentSegment(start=1.0, end=2.0, type=SegmentType.FRAME, payload="frame_0002.png"),
+        ],
+    )
+
+    frames = [segment.payload for segment in manifest.iter_segments(SegmentType.FRAME)]
+    assert frames == ["frame_0002.png", "frame_0003.png"]
+    assert list(manifest.iter_segments(SegmentType.METADATA)) == []
+    assert [segment.start for segment in manifest.iter_segments()] == [0.0, 1.0, 4.0]
+
+
 def test_alignment_manifest_requires_segments() -> None:
     with pytest.raises(ValueError):
         AlignmentManifest(timeline_id="timeline", source="foo.mp4", segments=[])
@@ -88,3 +105,18 @@ def test_manifest_iter_segments_filters_by_type() -> None:
     frames = list(manifest.iter_segments(SegmentType.FRAME))
     assert len(frames) == 1
     assert frames[0].type is SegmentType.FRAME
+
+
+def test_manifest_iter_segments_tracks_constructed_and_mutated_segments() -> None:
+    frame = AlignmentSegment(start=0.0, end=0.5, type=SegmentType.FRAME, payload="frame_1.png")
+    audio = AlignmentSegment(start=0.5, end=1.0, type=SegmentType.AUDIO, payload="hello")
+
+    constructed = AlignmentManifest.model_construct(timeline_id="timeline-raw", source="foo.mp4", segments=[frame])
+    assert list(constructed.iter_segments(SegmentType.FRAME)) == [frame]
+
+    manifest = AlignmentManifest(timeline_id="timeline-mutated", source="foo.mp4", segments=[frame])
+    assert list(manifest.iter_segments(SegmentType.AUDIO)) == []
+    manifest.segments.append(audio)
+    assert list(manifest.iter_segments(SegmentType.AUDIO)) == [audio]
+    manifest.segments = [audio]
+    assert list(manifest.iter_segments(SegmentType.FRAME)) == []
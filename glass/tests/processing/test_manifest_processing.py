@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import datetime as dt
+import sqlite3
 from pathlib import Path
 from typing import Iterable, List
 
 from glass.ingestion import AlignmentManifest, AlignmentSegment, SegmentType
 from glass.processing.chunkers import ManifestChunker
 from glass.processing.timeline_processor import GlassTimelineProcessor
+from glass.storage.context_repository import GlassContextRepository
 from glass.storage.models import Modality, MultimodalContextItem
 from opencontext.models.context import RawContextProperties
 from opencontext.models.enums import ContentFormat, ContextSource
@@ -27,6 +29,39 @@ def _build_manifest(frame_path: Path) -> AlignmentManifest:
     )
 
 
+def _frame_manifest(tmp_path: Path, count: int, *, timeline_id: str) -> AlignmentManifest:
+    frames = []
+    for index in range(count):
+        frame_path = tmp_path / f"frame_{index:04d}.png"
+        frame_path.write_text(f"fake-image-{index}")
+        frames.append(frame_path)
+    return AlignmentManifest(
+        timeline_id=timeline_id,
+        source="videos/sample.mp4",
+        segments=[
+            AlignmentSegment(start=float(index), end=float(index + 1), type=SegmentType.FRAME, payload=str(path))
+            for index, path in enumerate(frames)
+        ],
+    )
+
+
+def _inline_manifest_context(manifest: AlignmentManifest) -> RawContextProperties:
+    return RawContextProperties(
+        content_format=ContentFormat.VIDEO,
+        source=ContextSource.VIDEO,
+        create_time=_fixed_clock(),
+        additional_info={"timeline_id": manifest.timeline_id, "alignment_manifest": manifest.to_json()},
+    )
+
+
+def _build_processor(repository, visual_encoder) -> GlassTimelineProcessor:
+    return GlassTimelineProcessor(
+        repository=repository,
+        chunker=ManifestChunker(clock=_fixed_clock),
+        visual_encoder=visual_encoder,
+    )
+
+
 def test_manifest_chunker_builds_audio_and_frame_items(tmp_path: Path) -> None:
     frame_path = tmp_path / "frame_0001.png"
     frame_path.write_text("fake-image-bytes")
@@ -103,3 +138,188 @@ def test_timeline_processor_persists_contexts(tmp_path: Path) -> None:
     assert frame_item.embedding_ready is True
     assert processor.last_envelope is not None
     assert processor.last_envelope.timeline_id == manifest.timeline_id
+
+
+class _BatchVisualEncoder(_StubVisualEncoder):
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+
+    def encode(self, image_path: str):
+        raise AssertionError("processor should prefer encode_batch")
+
+    def encode_batch(self, image_paths):
+        self.batches.append(list(image_paths))
+        return [_StubVisualEncoder.encode(self, image_path) for image_path in image_paths]
+
+
+def test_timeline_processor_encodes_frames_in_one_batch(tmp_path: Path) -> None:
+    manifest = _frame_manifest(tmp_path, 3, timeline_id="timeline-batch")
+    encoder = _BatchVisualEncoder()
+    repository = _StubRepository()
+
+    _build_processor(repository, encoder).process(_inline_manifest_context(manifest))
+
+    assert encoder.batches == [[segment.payload for segment in manifest.segments]]
+    assert all(item.embedding_ready for item in repository.items)
+
+
+class _CachingRepository(_StubRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.embedding_cache: dict[tuple[str, str], List[float]] = {}
+
+    def fetch_cached_embeddings(self, digests, model):
+        return {
+            digest: self.embedding_cache[(digest, model)]
+            for digest in digests
+            if (digest, model) in self.embedding_cache
+        }
+
+    def store_cached_embeddings(self, vectors, model):
+        self.embedding_cache.update({(digest, model): vector for digest, vector in vectors.items()})
+
+
+class _CountingVisualEncoder(_StubVisualEncoder):
+    def __init__(self) -> None:
+        self.encoded: List[str] = []
+        self.model_key = "stub-model@3"
+
+    def encode(self, image_path: str):
+        self.encoded.append(image_path)
+        return super().encode(image_path)
+
+
+def test_timeline_processor_reuses_cached_frame_embeddings(tmp_path: Path) -> None:
+    frame_path = tmp_path / "frame_0001.png"
+    frame_path.write_text("fake-image")
+    repository = _CachingRepository()
+    encoder = _CountingVisualEncoder()
+    processor = _build_processor(repository, encoder)
+    raw_context = _inline_manifest_context(_build_manifest(frame_path))
+
+    processor.process(raw_context)
+    processor.process(raw_context)
+
+    assert encoder.encoded == [str(frame_path)]
+    frame_item = next(item for item in repository.items if item.modality is Modality.FRAME)
+    assert frame_item.embedding_ready is True
+    assert frame_item.context.vectorize.vector == [0.1, 0.2, 0.3]
+
+
+def test_timeline_processor_ignores_cached_embeddings_from_another_model(tmp_path: Path) -> None:
+    frame_path = tmp_path / "frame_0001.png"
+    frame_path.write_text("fake-image")
+    repository = _CachingRepository()
+    encoder = _CountingVisualEncoder()
+    processor = _build_processor(repository, encoder)
+    raw_context = _inline_manifest_context(_build_manifest(frame_path))
+
+    processor.process(raw_context)
+    encoder.model_key = "other-model@1024"
+    processor.process(raw_context)
+
+    assert encoder.encoded == [str(frame_path), str(frame_path)]
+    assert {model for _, model in repository.embedding_cache} == {"stub-model@3", "other-model@1024"}
+
+
+class _RecordingRepository(_StubRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[List[MultimodalContextItem]] = []
+
+    def upsert_aligned_segments(self, items: Iterable[MultimodalContextItem]) -> List[str]:
+        batch = list(items)
+        self.batches.append(batch)
+        return [item.context.id for item in batch]
+
+
+def test_timeline_processor_pipelines_large_manifests(tmp_path: Path) -> None:
+    manifest = _frame_manifest(tmp_path, 70, timeline_id="timeline-pipeline")
+    encoder = _BatchVisualEncoder()
+    repository = _RecordingRepository()
+    processor = _build_processor(repository, encoder)
+
+    processed_contexts = processor.process(_inline_manifest_context(manifest))
+
+    assert [len(batch) for batch in encoder.batches] == [64, 6]
+    assert [len(batch) for batch in repository.batches] == [64, 6]
+    persisted = [item for batch in repository.batches for item in batch]
+    assert len(processed_contexts) == len(persisted) == 70
+    assert all(item.embedding_ready for item in persisted)
+    assert processor.last_envelope is not None
+
+
+def _bootstrap_schema(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE glass_multimodal_context (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timeline_id TEXT NOT NULL,
+            context_id TEXT NOT NULL UNIQUE,
+            modality TEXT NOT NULL,
+            content_ref TEXT NOT NULL,
+            embedding_ready BOOLEAN DEFAULT 0,
+            context_type TEXT,
+            segment_start REAL,
+            segment_end REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    connection.execute(
+        """
+        CREATE TABLE glass_embedding_cache (
+            content_digest TEXT NOT NULL,
+            model TEXT NOT NULL,
+            vector BLOB NOT NULL,
+            dim INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (content_digest, model)
+        )
+        """
+    )
+
+
+class _MemoryStorage:
+    def __init__(self, fail_on_call: int | None = None) -> None:
+        self.calls = 0
+        self._fail_on_call = fail_on_call
+
+    def batch_upsert_processed_context(self, contexts):
+        self.calls += 1
+        if self.calls == self._fail_on_call:
+            raise RuntimeError("vector store unavailable")
+        return [context.id for context in contexts]
+
+
+def _process_with_sqlite(tmp_path: Path, storage: _MemoryStorage):
+    # Default check_same_thread=True: every repository call must stay on this thread.
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    _bootstrap_schema(connection)
+    repository = GlassContextRepository(storage=storage, connection=connection)
+    processor = _build_processor(repository, _BatchVisualEncoder())
+    manifest = _frame_manifest(tmp_path, 70, timeline_id="timeline-sqlite")
+    processed_contexts = processor.process(_inline_manifest_context(manifest))
+    (row_count,) = connection.execute("SELECT COUNT(*) FROM glass_multimodal_context").fetchone()
+    return processed_contexts, row_count
+
+
+def test_timeline_processor_pipelines_large_manifests_into_sqlite(tmp_path: Path) -> None:
+    storage = _MemoryStorage()
+
+    processed_contexts, row_count = _process_with_sqlite(tmp_path, storage)
+
+    assert storage.calls == 2
+    assert len(processed_contexts) == row_count == 70
+
+
+def test_timeline_processor_large_manifest_failure_keeps_committed_batches(tmp_path: Path) -> None:
+    storage = _MemoryStorage(fail_on_call=2)
+
+    processed_contexts, row_count = _process_with_sqlite(tmp_path, storage)
+
+    # Batches commit independently: the failed batch rolls back, earlier ones stay.
+    assert processed_contexts == []
+    assert row_count == 64
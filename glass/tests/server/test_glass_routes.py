@@ -132,3 +132,38 @@ def test_context_endpoint_serializes_envelope(tmp_path: Path) -> None:
     data = response.json()["data"]
     assert data["timeline_id"] == timeline_id
     assert data["items"][0]["modality"] == Modality.AUDIO.value
+
+
+class _VersionedRepository(_StubRepository):
+    def __init__(self, envelopes: dict[str, ContextEnvelope]):
+        super().__init__(envelopes)
+        self.version = 0
+        self.loads = 0
+
+    def data_version(self) -> int:
+        return self.version
+
+    def load_envelope(self, timeline_id: str) -> ContextEnvelope | None:
+        self.loads += 1
+        return super().load_envelope(timeline_id)
+
+
+def test_context_endpoint_reuses_body_until_repository_changes(tmp_path: Path) -> None:
+    service = _StubIngestionService(tmp_path)
+    envelope = ContextEnvelope(timeline_id="timeline-poll", source="video.mp4", items=[])
+    repository = _VersionedRepository({"timeline-poll": envelope})
+    client = _make_fastapi_app(service, repository)
+
+    first = client.get("/glass/context/timeline-poll")
+    second = client.get("/glass/context/timeline-poll")
+    assert first.content == second.content
+    assert repository.loads == 1
+
+    etag = first.headers["etag"]
+    not_modified = client.get("/glass/context/timeline-poll", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert repository.loads == 1
+
+    repository.version += 1
+    client.get("/glass/context/timeline-poll")
+    assert repository.loads == 2
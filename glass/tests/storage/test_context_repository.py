@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import datetime
 import sqlite3
+import threading
 import uuid
 from collections import defaultdict
 
 import pytest
 
 from glass.storage import GlassContextRepository, Modality, MultimodalContextItem
+from glass.storage.context_repository import _CONNECTION_LOCK
 from opencontext.models.context import (
     ContextProperties,
     ExtractedData,
@@ -29,11 +31,25 @@ def _bootstrap_schema(connection: sqlite3.Connection) -> None:
             content_ref TEXT NOT NULL,
             embedding_ready BOOLEAN DEFAULT 0,
             context_type TEXT,
+            segment_start REAL,
+            segment_end REAL,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
         )
         """
     )
+    connection.execute(
+        """
+        CREATE TABLE glass_embedding_cache (
+            content_digest TEXT NOT NULL,
+            model TEXT NOT NULL,
+            vector BLOB NOT NULL,
+            dim INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (content_digest, model)
+        )
+        """
+    )
 
 
 def _make_context(
@@ -105,6 +121,141 @@ def _make_repo(connection: sqlite3.Connection, storage: _FakeStorage | None = No
     return GlassContextRepository(storage=storage, connection=connection)
 
 
+class _BackendStorage(_FakeStorage):
+    def __init__(self, connection: sqlite3.Connection, db_path: str | None = None) -> None:
+        super().__init__()
+        self._backend = type("_Backend", (), {"connection": connection, "db_path": db_path})()
+
+    def get_default_backend(self, storage_type):
+        return self._backend
+
+
+def test_resolved_connection_is_tuned_for_wal(tmp_path) -> None:
+    connection = sqlite3.connect(tmp_path / "glass.db")
+    _bootstrap_schema(connection)
+
+    GlassContextRepository(storage=_BackendStorage(connection))
+
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert connection.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_connection_preset_to_normal_sync_is_still_tuned(tmp_path) -> None:
+    connection = sqlite3.connect(tmp_path / "glass.db")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    _bootstrap_schema(connection)
+
+    GlassContextRepository(storage=_BackendStorage(connection))
+
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert connection.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    assert connection.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+
+def test_injected_memory_connection_skips_wal(tmp_path) -> None:
+    memory = sqlite3.connect(":memory:")
+    _make_repo(memory)
+    assert memory.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+    assert memory.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+
+    on_disk = sqlite3.connect(tmp_path / "injected.db")
+    _make_repo(on_disk)
+    assert on_disk.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_reads_use_per_thread_read_only_connections(tmp_path) -> None:
+    db_path = tmp_path / "glass.db"
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    _bootstrap_schema(connection)
+    repo = GlassContextRepository(storage=_BackendStorage(connection, str(db_path)))
+
+    context = _make_context("threaded read")
+    repo.upsert_aligned_segments(
+        [
+            MultimodalContextItem(
+                context=context,
+                timeline_id="timeline-readers",
+                modality=Modality.AUDIO,
+                content_ref="segment-001",
+            )
+        ]
+    )
+
+    results: dict[str, object] = {}
+
+    def _read() -> None:
+        results["rows"] = repo.fetch_by_timeline("timeline-readers")
+        results["reader"] = repo._reader_connection()
+
+    worker = threading.Thread(target=_read)
+    worker.start()
+    worker.join()
+
+    assert [row["context_id"] for row in results["rows"]] == [context.id]
+    assert results["reader"] is not connection
+    assert results["reader"] is not repo._reader_connection()
+    assert repo._reader_connection().execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert repo._reader_connection().execute("PRAGMA cache_size").fetchone()[0] == -65536
+    with pytest.raises(sqlite3.OperationalError):
+        repo._reader_connection().execute("DELETE FROM glass_multimodal_context")
+
+
+def test_close_releases_reader_connections(tmp_path) -> None:
+    db_path = tmp_path / "glass.db"
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    _bootstrap_schema(connection)
+    repo = GlassContextRepository(storage=_BackendStorage(connection, str(db_path)))
+
+    opened: list[sqlite3.Connection] = []
+    worker = threading.Thread(target=lambda: opened.append(repo._reader_connection()))
+    worker.start()
+    worker.join()
+    opened.append(repo._reader_connection())
+    repo.data_version()
+
+    repo.close()
+
+    for reader in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            reader.execute("SELECT 1")
+    # The shared connection stays open and readers reopen on demand.
+    connection.execute("SELECT 1")
+    assert repo.fetch_by_timeline("timeline-closed") == []
+    assert repo._reader_connection() not in opened
+
+
+def test_data_version_does_not_wait_on_the_writer_lock(tmp_path) -> None:
+    db_path = tmp_path / "glass.db"
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    _bootstrap_schema(connection)
+    repo = GlassContextRepository(storage=_BackendStorage(connection, str(db_path)))
+    before = repo.data_version()
+
+    repo.upsert_aligned_segments(
+        [
+            MultimodalContextItem(
+                context=_make_context("versioned"),
+                timeline_id="timeline-version",
+                modality=Modality.AUDIO,
+                content_ref="segment-001",
+            )
+        ]
+    )
+    after = repo.data_version()
+    assert after != before
+
+    results: list[object] = []
+    with _CONNECTION_LOCK:
+        # A writer holding the shared connection must not block change-token polls.
+        worker = threading.Thread(target=lambda: results.append(repo.data_version()))
+        worker.start()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+    assert results == [after]
+
+
 def test_upsert_persists_and_fetches_segments() -> None:
     connection = sqlite3.connect(":memory:")
     storage = _FakeStorage()
@@ -234,6 +385,215 @@ def test_upsert_rolls_back_on_failure() -> None:
     assert not connection.in_transaction
 
 
+def test_upsert_runs_batch_inside_single_immediate_transaction() -> None:
+    connection = sqlite3.connect(":memory:")
+    storage = _FakeStorage()
+    repo = _make_repo(connection, storage)
+
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+
+    items = [
+        MultimodalContextItem(
+            context=_make_context(f"batch-{index}"),
+            timeline_id="timeline-batch",
+            modality=Modality.FRAME,
+            content_ref=f"frame-{index}.png",
+            embedding_ready=True,
+        )
+        for index in range(3)
+    ]
+    repo.upsert_aligned_segments(items)
+    connection.set_trace_callback(None)
+
+    assert [stmt for stmt in statements if stmt.startswith(("BEGIN", "COMMIT"))] == [
+        "BEGIN IMMEDIATE",
+        "COMMIT",
+    ]
+    assert not connection.in_transaction
+    assert len(repo.fetch_by_timeline("timeline-batch")) == 3
+
+
+def test_upsert_nests_in_caller_transaction_via_savepoint() -> None:
+    connection = sqlite3.connect(":memory:")
+    storage = _FakeStorage()
+    repo = _make_repo(connection, storage)
+
+    def _item(text: str) -> MultimodalContextItem:
+        return MultimodalContextItem(
+            context=_make_context(text),
+            timeline_id="timeline-nested",
+            modality=Modality.TEXT,
+            content_ref=f"{text}.txt",
+        )
+
+    connection.execute("BEGIN")
+    repo.upsert_aligned_segments([_item("kept")])
+    assert connection.in_transaction
+
+    with pytest.raises(sqlite3.IntegrityError):
+        bad = _item("bad")
+        bad.content_ref = None  # violates NOT NULL inside the savepoint
+        repo.upsert_aligned_segments([bad])
+    assert connection.in_transaction
+    assert len(repo.fetch_by_timeline("timeline-nested")) == 1
+
+    connection.rollback()
+    assert repo.fetch_by_timeline("timeline-nested") == []
+
+
+def test_upsert_packs_large_batches_into_multirow_statements() -> None:
+    connection = sqlite3.connect(":memory:")
+    storage = _FakeStorage()
+    repo = _make_repo(connection, storage)
+
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+
+    items = [
+        MultimodalContextItem(
+            context=_make_context(f"bulk-{index}"),
+            timeline_id="timeline-bulk",
+            modality=Modality.AUDIO,
+            content_ref=f"segment-{index:03d}",
+            embedding_ready=False,
+        )
+        for index in range(250)
+    ]
+    ids = repo.upsert_aligned_segments(items)
+    connection.set_trace_callback(None)
+
+    inserts = [stmt for stmt in statements if "INSERT INTO glass_multimodal_context" in stmt]
+    # Two full 100-row statements, then the 50-row tail as single-row executemany calls.
+    assert len(inserts) == 2 + 50
+    assert ids == [item.context.id for item in items]
+    rows = repo.fetch_by_timeline("timeline-bulk")
+    assert {row["content_ref"] for row in rows} == {f"segment-{index:03d}" for index in range(250)}
+
+
+class _BatchFetchStorage(_FakeStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_calls: list[tuple[str, list[str]]] = []
+
+    def batch_get_processed_context(self, ids: list[str], context_type: str):
+        self.batch_calls.append((context_type, list(ids)))
+        return [
+            self.contexts[(context_type, context_id)]
+            for context_id in ids
+            if (context_type, context_id) in self.contexts
+        ]
+
+    def get_processed_context(self, context_id: str, context_type: str):
+        raise AssertionError("load_envelope should use batch lookups when available")
+
+
+def test_load_envelope_batches_context_lookups_per_type() -> None:
+    connection = sqlite3.connect(":memory:")
+    storage = _BatchFetchStorage()
+    repo = _make_repo(connection, storage)
+
+    items = [
+        MultimodalContextItem(
+            context=_make_context(f"batched-{index}", metadata={"segment_start": float(index)}),
+            timeline_id="timeline-batched",
+            modality=Modality.AUDIO,
+            content_ref=f"segment-{index}",
+        )
+        for index in range(4)
+    ]
+    repo.upsert_aligned_segments(items)
+
+    envelope = repo.load_envelope("timeline-batched")
+
+    assert envelope is not None
+    assert len(envelope.items) == 4
+    assert len(storage.batch_calls) == 1
+    context_type, ids = storage.batch_calls[0]
+    assert context_type == ContextType.SEMANTIC_CONTEXT.value
+    assert sorted(ids) == sorted(item.context.id for item in items)
+
+
+def test_upsert_maps_ids_back_across_interleaved_context_types() -> None:
+    connection = sqlite3.connect(":memory:")
+    storage = _FakeStorage()
+    repo = _make_repo(connection, storage)
+
+    context_types = [ContextType.ACTIVITY_CONTEXT, ContextType.STATE_CONTEXT, ContextType.SEMANTIC_CONTEXT]
+    items = [
+        MultimodalContextItem(
+            context=_make_context(f"mixed-{index}", context_type=context_types[index % 3]),
+            timeline_id="timeline-mixed",
+            modality=Modality.METADATA,
+            content_ref=f"meta-{index}.json",
+        )
+        for index in range(9)
+    ]
+
+    ids = repo.upsert_aligned_segments(items)
+
+    assert ids == [item.context.id for item in items]
+    assert len(storage.contexts) == 9
+    rows = {row["context_id"]: row for row in repo.fetch_by_timeline("timeline-mixed")}
+    for item in items:
+        assert rows[item.context.id]["context_type"] == item.context.extracted_data.context_type.value
+
+
+def test_load_envelope_skips_rows_with_unknown_modality() -> None:
+    connection = sqlite3.connect(":memory:")
+    storage = _FakeStorage()
+    repo = _make_repo(connection, storage)
+
+    context = _make_context("known")
+    repo.upsert_aligned_segments(
+        [
+            MultimodalContextItem(
+                context=context,
+                timeline_id="timeline-modality",
+                modality=Modality.TEXT,
+                content_ref="note.txt",
+            )
+        ]
+    )
+    connection.execute(
+        "INSERT INTO glass_multimodal_context (timeline_id, context_id, modality, content_ref, context_type) "
+        "VALUES (?, ?, ?, ?, ?)",
+        ("timeline-modality", "legacy-row", "hologram", "legacy.bin", ContextType.SEMANTIC_CONTEXT.value),
+    )
+    connection.commit()
+
+    envelope = repo.load_envelope("timeline-modality")
+
+    assert envelope is not None
+    assert [item.context.id for item in envelope.items] == [context.id]
+
+
+def test_modality_filter_is_applied_in_sql() -> None:
+    connection = sqlite3.connect(":memory:")
+    storage = _FakeStorage()
+    repo = _make_repo(connection, storage)
+
+    audio = _make_context("audio", metadata={"segment_start": 0.0})
+    frame = _make_context("frame", metadata={"segment_start": 1.0})
+    repo.upsert_aligned_segments(
+        [
+            MultimodalContextItem(
+                context=audio, timeline_id="timeline-filter", modality=Modality.AUDIO, content_ref="a"
+            ),
+            MultimodalContextItem(
+                context=frame, timeline_id="timeline-filter", modality=Modality.FRAME, content_ref="f.png"
+            ),
+        ]
+    )
+
+    rows = repo.fetch_by_timeline("timeline-filter", modalities=[Modality.FRAME])
+    assert [row["context_id"] for row in rows] == [frame.id]
+
+    envelope = repo.load_envelope("timeline-filter", modalities=[Modality.AUDIO, Modality.AUDIO])
+    assert envelope is not None
+    assert [item.context.id for item in envelope.items] == [audio.id]
+
+
 def test_load_envelope_recovers_contexts_sorted_by_segment() -> None:
     connection = sqlite3.connect(":memory:")
     storage = _FakeStorage()
@@ -286,3 +646,62 @@ def test_load_envelope_recovers_contexts_sorted_by_segment() -> None:
     assert envelope.timeline_id == "timeline-42"
     assert envelope.source == "videos/sample.mp4"
     assert [item.context.id for item in envelope.items] == [frame_context.id, audio_context.id]
+
+
+def test_rows_without_segment_columns_sort_in_python_until_backfilled() -> None:
+    connection = sqlite3.connect(":memory:")
+    repo = _make_repo(connection)
+
+    starts = [4.0, 5.0, 1.0, 3.0, 2.0, 6.0]
+    contexts = [
+        _make_context(f"segment {start:g}", metadata={"segment_start": start, "segment_end": start + 0.5})
+        for start in starts
+    ]
+    repo.upsert_aligned_segments(
+        [
+            MultimodalContextItem(
+                context=context,
+                timeline_id="legacy",
+                modality=Modality.FRAME,
+                content_ref=f"frame-{index}.png",
+            )
+            for index, context in enumerate(contexts)
+        ]
+    )
+    # Simulate rows written before the segment columns were added.
+    connection.execute("UPDATE glass_multimodal_context SET segment_start = NULL, segment_end = NULL")
+    connection.commit()
+
+    version = repo.data_version()
+    envelope = repo.load_envelope("legacy")
+
+    assert envelope is not None
+    assert [item.context.metadata["segment_start"] for item in envelope.items] == [6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    # Loading stays read-only: no backfill, and cached envelopes remain valid.
+    assert repo.data_version() == version
+    assert connection.execute(
+        "SELECT COUNT(*) FROM glass_multimodal_context WHERE segment_start IS NULL"
+    ).fetchone()[0] == 6
+
+    assert repo.backfill_segment_bounds() == 6
+    assert repo.backfill_segment_bounds() == 0
+    reloaded = repo.load_envelope("legacy")
+    assert [item.context.id for item in reloaded.items] == [item.context.id for item in envelope.items]
+    backfilled = connection.execute(
+        "SELECT segment_start, segment_end FROM glass_multimodal_context ORDER BY segment_start"
+    ).fetchall()
+    assert [tuple(row) for row in backfilled] == [(start, start + 0.5) for start in sorted(starts)]
+
+
+def test_embedding_cache_round_trips_float32_vectors() -> None:
+    connection = sqlite3.connect(":memory:")
+    repo = _make_repo(connection)
+
+    repo.store_cached_embeddings({"digest-a": [0.5, -1.25, 2.0], "digest-empty": []}, "model-a@3")
+    # Existing entries are kept; the first embedding for a digest wins.
+    repo.store_cached_embeddings({"digest-a": [9.0, 9.0, 9.0]}, "model-a@3")
+
+    cached = repo.fetch_cached_embeddings(["digest-a", "digest-missing", "digest-empty", "digest-a"], "model-a@3")
+
+    assert cached == {"digest-a": [0.5, -1.25, 2.0]}
+    assert repo.fetch_cached_embeddings(["digest-a"], "model-b@3") == {}
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sqlite3
+
+from glass.storage.context_repository import _FETCH_TIMELINE_SQL
+from opencontext.storage.backends.sqlite_backend import SQLiteBackend
+
+
+def test_timeline_fetch_uses_segment_index_without_sorting(tmp_path) -> None:
+    backend = SQLiteBackend()
+    assert backend.initialize({"config": {"path": str(tmp_path / "app.db")}})
+
+    plan = [
+        row[3]
+        for row in backend.connection.execute(f"EXPLAIN QUERY PLAN {_FETCH_TIMELINE_SQL}", ("timeline",))
+    ]
+
+    assert any("idx_glass_multimodal_timeline_segment" in detail for detail in plan)
+    assert not any("TEMP B-TREE" in detail for detail in plan)
+
+
+def test_legacy_glass_table_gains_segment_columns(tmp_path) -> None:
+    db_path = tmp_path / "app.db"
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        """
+        CREATE TABLE glass_multimodal_context (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timeline_id TEXT NOT NULL,
+            context_id TEXT NOT NULL,
+            modality TEXT NOT NULL,
+            content_ref TEXT NOT NULL,
+            embedding_ready BOOLEAN DEFAULT 0,
+            context_type TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(context_id)
+        )
+        """
+    )
+    legacy.executemany(
+        "INSERT INTO glass_multimodal_context (timeline_id, context_id, modality, content_ref) VALUES (?, ?, ?, ?)",
+        [("timeline", f"ctx-{index}", "frame", f"frame-{index}.png") for index in range(3)],
+    )
+    legacy.commit()
+    legacy.close()
+
+    backend = SQLiteBackend()
+    assert backend.initialize({"config": {"path": str(db_path)}})
+
+    columns = {row[1] for row in backend.connection.execute("PRAGMA table_info(glass_multimodal_context)")}
+    assert {"segment_start", "segment_end"} <= columns
+    rows = backend.connection.execute(_FETCH_TIMELINE_SQL, ("timeline",)).fetchall()
+    assert len(rows) == 3
+    # Legacy rows keep NULL bounds until the repository backfills them from context metadata.
+    assert all(row[-1] for row in rows)
+
+
+def test_glass_table_keeps_only_the_indexes_queries_use(tmp_path) -> None:
+    backend = SQLiteBackend()
+    assert backend.initialize({"config": {"path": str(tmp_path / "app.db")}})
+
+    indexes = {
+        row[1]
+        for row in backend.connection.execute("PRAGMA index_list(glass_multimodal_context)")
+        if not row[1].startswith("sqlite_autoindex")
+    }
+
+    assert indexes == {"idx_glass_multimodal_timeline_segment", "idx_glass_multimodal_context_id"}
@@ -18,3 +18,17 @@ def test_glass_dashboard_contains_upload_hooks() -> None:
     assert 'id="glass-dropzone"' in html
     assert 'id="glass-file-input"' in html
     assert "fetch('/glass/upload'" in html
+
+
+def test_glass_dashboard_revalidates_with_etag() -> None:
+    app = FastAPI()
+    app.include_router(ui_router)
+    client = TestClient(app)
+
+    first = client.get("/glass")
+    etag = first.headers["etag"]
+
+    second = client.get("/glass", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
@@ -7,10 +7,13 @@ from __future__ import annotations
 
 """MineContext Glass web UI routes."""
 
+import hashlib
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from jinja2 import ChoiceLoader, FileSystemLoader
 
@@ -27,13 +30,20 @@ templates.env.loader = ChoiceLoader([
 ])
 
 
+@lru_cache(maxsize=1)
+def _render_dashboard() -> Tuple[bytes, str]:
+    """Render the dashboard once; it only depends on the title, not on the request."""
+    html = templates.get_template("glass_dashboard.html").render(title="Glass Timeline")
+    body = html.encode("utf-8")
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return body, etag
+
+
 @router.get("", response_class=HTMLResponse, include_in_schema=False)
 @router.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def glass_dashboard(request: Request) -> HTMLResponse:
-    return templates.TemplateResponse(
-        "glass_dashboard.html",
-        {
-            "request": request,
-            "title": "Glass Timeline",
-        },
-    )
+async def glass_dashboard(request: Request) -> Response:
+    body, etag = _render_dashboard()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
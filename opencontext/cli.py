@@ -9,6 +9,8 @@ Command-line interface - provides the entry point for command-line tools
 
 import argparse
 import asyncio
+import os
+import shutil
 import sys
 import time
 from contextlib import asynccontextmanager
@@ -30,6 +32,9 @@ from opencontext.utils.logging_utils import setup_logging, get_logger
 
 logger = get_logger(__name__)
 
+# Copy buffer used when streaming timeline reports into the daily aggregate.
+_REPORT_COPY_BUFFER = 64 * 1024
+
 # Global variables for multi-process support
 _config_path = None
 _context_lab_instance = None
@@ -337,13 +342,21 @@ def _parse_time_argument(value: Optional[str]) -> Optional[int]:
 
 def _resolve_report_window(args: argparse.Namespace) -> tuple[int, int]:
     """Resolve start/end timestamps for Glass report generation."""
-    start_ts = _parse_time_argument(getattr(args, "start", None))
-    end_ts = _parse_time_argument(getattr(args, "end", None))
+    raw_start = getattr(args, "start", None)
+    raw_end = getattr(args, "end", None)
+    lookback_minutes = max(getattr(args, "lookback_minutes", 60), 1)
+
+    if raw_start is None and raw_end is None:
+        # Common case: no explicit window, so skip ISO parsing and datetime objects.
+        end_ts = int(time.time())
+        return end_ts - lookback_minutes * 60, end_ts
+
+    start_ts = _parse_time_argument(raw_start)
+    end_ts = _parse_time_argument(raw_end)
 
     if start_ts is None or end_ts is None:
         now_ts = int(datetime.now(tz=timezone.utc).timestamp())
         end_ts = end_ts or now_ts
-        lookback_minutes = max(getattr(args, "lookback_minutes", 60), 1)
         start_ts = start_ts or end_ts - lookback_minutes * 60
 
     if end_ts <= start_ts:
@@ -479,30 +492,34 @@ def _render_daily_report(
 ) -> Path:
     """Compose a single Markdown file aggregating all timeline reports."""
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
-    lines = [
-        f"# Glass Daily Report - {date_token}",
-        "",
-        f"_Generated at {timestamp}_",
-        "",
-    ]
-
-    for result in results:
-        lines.append(f"## Timeline: {result.timeline_id}")
-        lines.append(f"Source video: `{result.video_path.name}`")
-        lines.append("")
-        if result.report_path and result.report_path.exists():
-            content = result.report_path.read_text(encoding="utf-8")
-            lines.append(content)
-        else:
-            lines.append("_No report content produced for this timeline._")
-        lines.append("")
-
     report_dir.mkdir(parents=True, exist_ok=True)
     aggregate_path = report_dir / f"{date_token}-daily.md"
-    aggregate_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+
+    # Stream each timeline report straight into the aggregate (bytes in, bytes out) instead of
+    # concatenating every report into one in-memory string.
+    with aggregate_path.open("wb") as output:
+        output.write(f"# Glass Daily Report - {date_token}\n\n_Generated at {timestamp}_\n".encode("utf-8"))
+        for result in results:
+            header = f"\n## Timeline: {result.timeline_id}\nSource video: `{result.video_path.name}`\n\n"
+            output.write(header.encode("utf-8"))
+            if result.report_path and result.report_path.exists():
+                with result.report_path.open("rb") as source:
+                    shutil.copyfileobj(source, output, _REPORT_COPY_BUFFER)
+                    if not _ends_with_newline(source):
+                        output.write(b"\n")
+            else:
+                output.write(b"_No report content produced for this timeline._\n")
     return aggregate_path
 
 
+def _ends_with_newline(handle) -> bool:
+    """Check the last byte of a binary file handle (empty files count as unterminated)."""
+    if handle.seek(0, os.SEEK_END) == 0:
+        return False
+    handle.seek(-1, os.SEEK_END)
+    return handle.read(1) == b"\n"
+
+
 def handle_glass(args: argparse.Namespace) -> int:
     """Dispatch Glass sub-commands."""
     if not getattr(args, "glass_command", None):
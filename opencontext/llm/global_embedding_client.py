@@ -106,6 +106,15 @@ class GlobalEmbeddingClient:
                 return False
             return True
 
+    def model_signature(self) -> Optional[str]:
+        """
+        Identify the configured embedding model and output dimension, or None if uninitialized
+        """
+        client = self._embedding_client
+        if client is None:
+            return None
+        return f"{client.model}@{client.config.get('output_dim', 0)}"
+
     def do_embedding(self, text: str, **kwargs) -> List[float]:
         """
         Get text embeddings
@@ -124,6 +133,9 @@ class GlobalEmbeddingClient:
 def is_initialized() -> bool:
     return GlobalEmbeddingClient.get_instance().is_initialized()
 
+def model_signature() -> Optional[str]:
+    return GlobalEmbeddingClient.get_instance().model_signature()
+
 def do_embedding(text: str, **kwargs) -> List[float]:
     return GlobalEmbeddingClient.get_instance().do_embedding(text, **kwargs)
 
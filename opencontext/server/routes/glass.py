@@ -7,9 +7,16 @@ from __future__ import annotations
 
 """Glass-specific API endpoints."""
 
+import hashlib
+import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import BinaryIO, Tuple
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 
 from glass.ingestion import (
     IngestionStatus,
@@ -24,6 +31,9 @@ from opencontext.server.utils import convert_resp, get_context_lab
 
 router = APIRouter(prefix="/glass", tags=["glass"])
 
+_CONTEXT_CACHE_SIZE = 64
+_CONTEXT_CACHE_LOCK = threading.Lock()
+
 
 def _get_ingestion_service(request: Request, context_lab: OpenContext = Depends(get_context_lab)) -> GlassIngestionService:
     service = getattr(request.app.state, "glass_ingestion_service", None)
@@ -43,14 +53,20 @@ def _get_repository(request: Request) -> GlassContextRepository:
     return repository
 
 
-async def _persist_upload(file: UploadFile, destination: Path) -> None:
+_UPLOAD_COPY_BUFFER = 1024 * 1024
+
+
+def _copy_upload(source: BinaryIO, destination: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     with destination.open("wb") as buffer:
-        while True:
-            chunk = await file.read(1024 * 1024)
-            if not chunk:
-                break
-            buffer.write(chunk)
+        shutil.copyfileobj(source, buffer, _UPLOAD_COPY_BUFFER)
+
+
+async def _persist_upload(file: UploadFile, destination: Path) -> None:
+    # Copy the spooled upload in one worker-thread call instead of awaiting a hop per chunk
+    # and writing to disk on the event loop.
+    await file.seek(0)
+    await run_in_threadpool(_copy_upload, file.file, destination)
 
 
 @router.post("/upload")
@@ -94,12 +110,45 @@ def get_status(
 @router.get("/context/{timeline_id}")
 def get_context(
     timeline_id: str,
+    request: Request,
     repository: GlassContextRepository = Depends(_get_repository),
-) -> dict:
-    envelope = repository.load_envelope(timeline_id)
-    if envelope is None:
-        raise HTTPException(status_code=404, detail="context not ready for timeline")
-    return convert_resp(envelope)
+) -> Response:
+    data_version = getattr(repository, "data_version", None)
+    version = data_version() if data_version is not None else None
+    cache = _get_context_cache(request)
+
+    cached = cache.get(timeline_id) if version is not None else None
+    if cached is None or cached[0] != version:
+        envelope = repository.load_envelope(timeline_id)
+        if envelope is None:
+            raise HTTPException(status_code=404, detail="context not ready for timeline")
+        response = convert_resp(envelope)
+        etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+        cached = (version, response.body, etag)
+        if version is not None:
+            with _CONTEXT_CACHE_LOCK:
+                cache[timeline_id] = cached
+                cache.move_to_end(timeline_id)
+                if len(cache) > _CONTEXT_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+    _, body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _get_context_cache(request: Request) -> "OrderedDict[str, Tuple[object, bytes, str]]":
+    # Encoded /context bodies, reused while the repository's data_version is unchanged so
+    # polling clients skip envelope loading and JSON encoding until new segments land.
+    cache = getattr(request.app.state, "glass_context_cache", None)
+    if cache is None:
+        with _CONTEXT_CACHE_LOCK:
+            cache = getattr(request.app.state, "glass_context_cache", None)
+            if cache is None:
+                cache = OrderedDict()
+                setattr(request.app.state, "glass_context_cache", cache)
+    return cache
 
 
 def _safe_status_lookup(ingestion: GlassIngestionService, timeline_id: str) -> IngestionStatus:
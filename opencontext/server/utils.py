@@ -11,7 +11,7 @@ import json
 from typing import Any
 
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from opencontext.server.opencontext import OpenContext
 from opencontext.utils.json_encoder import CustomJSONEncoder
@@ -35,9 +35,17 @@ def convert_resp(data: Any = None, code: int = 0, status: int = 200, message: st
     if data is not None:
         content["data"] = data
     
-    # Use CustomJSONEncoder to handle datetime and other special types
-    json_content = json.dumps(content, cls=CustomJSONEncoder)
-    return JSONResponse(
+    # Use CustomJSONEncoder to handle datetime and other special types. The encoded text is
+    # sent as-is (same settings JSONResponse.render uses) rather than decoded and re-encoded.
+    json_content = json.dumps(
+        content,
+        cls=CustomJSONEncoder,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    )
+    return Response(
         status_code=status,
-        content=json.loads(json_content)
+        content=json_content.encode("utf-8"),
+        media_type=JSONResponse.media_type,
     )
\ No newline at end of file
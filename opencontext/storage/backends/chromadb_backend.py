@@ -284,10 +284,12 @@ class ChromaDBBackend(IVectorStorageBackend):
         """
         Convert the context object to a document format for storage
         """
-        doc = context.model_dump(exclude_none=True, exclude={'properties', 'extracted_data', 'vectorize', 'metadata'})
+        # One serializer pass over the model; the nested sections are split back out below.
+        doc = context.model_dump(exclude_none=True, exclude={'vectorize', 'metadata'})
+        extracted_data_dict = doc.pop('extracted_data', None)
+        properties_dict = doc.pop('properties', None)
 
         if context.extracted_data:
-            extracted_data_dict = context.extracted_data.model_dump(exclude_none=True)
             doc.update(extracted_data_dict)
 
         if context.metadata:
@@ -299,7 +301,6 @@ class ChromaDBBackend(IVectorStorageBackend):
             doc["embedding"] = context.vectorize.vector
 
         if context.properties:
-            properties_dict = context.properties.model_dump(exclude_none=True)
             doc.update(properties_dict)
 
         def default_json_serializer(obj):
@@ -340,12 +341,9 @@ class ChromaDBBackend(IVectorStorageBackend):
         if not self._ensure_connection():
             raise RuntimeError("ChromaDB connection not available")
 
-        contexts_by_type = {}
+        contexts_by_type: Dict[str, List[ProcessedContext]] = {}
         for context in contexts:
-            context_type = context.extracted_data.context_type.value
-            if context_type not in contexts_by_type:
-                contexts_by_type[context_type] = []
-            contexts_by_type[context_type].append(context)
+            contexts_by_type.setdefault(context.extracted_data.context_type.value, []).append(context)
         
         stored_ids = []
         
@@ -445,6 +443,29 @@ class ChromaDBBackend(IVectorStorageBackend):
             logger.debug(f"Failed to search context {id} in {context_type} collection: {e}")
             return None
 
+    def batch_get_processed_context(self, ids: List[str], context_type: str) -> List[ProcessedContext]:
+        """Get ProcessedContexts by IDs with a single collection lookup"""
+        if not self._initialized or not ids:
+            return []
+
+        if context_type not in self._collections:
+            return []
+        try:
+            result = self._collections[context_type].get(
+                ids=list(ids),
+                include=["metadatas", "documents"]
+            )
+        except Exception as e:
+            logger.debug(f"Failed to batch fetch {len(ids)} contexts from {context_type} collection: {e}")
+            return []
+
+        contexts = []
+        for doc_id, document, metadata in zip(result['ids'], result['documents'], result['metadatas']):
+            context = self._chroma_result_to_context({'id': doc_id, 'document': document, 'metadata': metadata})
+            if context:
+                contexts.append(context)
+        return contexts
+
     def get_all_processed_contexts(self, 
                                   context_types: Optional[List[str]] = None,
                                   limit: int = 100, offset: int = 0, 
@@ -42,7 +42,8 @@ class SQLiteBackend(IDocumentStorageBackend):
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            # Larger statement cache keeps the hot Glass upsert/fetch statements prepared
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
             self.connection.row_factory = sqlite3.Row  # Allow column name access
             
             # Create table structure
@@ -139,6 +140,7 @@ class SQLiteBackend(IDocumentStorageBackend):
 
         # Glass multimodal context table
         self._create_glass_tables(cursor)
+        self._create_glass_embedding_cache(cursor)
 
         # New table indexes
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_vaults_created ON vaults (created_at)')
@@ -151,8 +153,15 @@ class SQLiteBackend(IDocumentStorageBackend):
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_activity_time ON activity (start_time, end_time)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_tips_time ON tips (created_at)')
         
+        # The segment index below leads with timeline_id and serves every timeline lookup, so the
+        # earlier timeline-only and (timeline_id, context_id) indexes would only slow upserts.
+        cursor.execute('DROP INDEX IF EXISTS idx_glass_multimodal_timeline')
+        cursor.execute('DROP INDEX IF EXISTS idx_glass_multimodal_timeline_context')
+        # Lets timeline fetches stream newest-segment-first straight from the index without sorting.
         cursor.execute(
-            'CREATE INDEX IF NOT EXISTS idx_glass_multimodal_timeline ON glass_multimodal_context (timeline_id)'
+            'CREATE INDEX IF NOT EXISTS idx_glass_multimodal_timeline_segment '
+            'ON glass_multimodal_context '
+            '(timeline_id, COALESCE(segment_end, segment_start, 0) DESC, context_id DESC)'
         )
         cursor.execute(
             'CREATE INDEX IF NOT EXISTS idx_glass_multimodal_context_id ON glass_multimodal_context (context_id)'
@@ -175,6 +184,8 @@ class SQLiteBackend(IDocumentStorageBackend):
                 content_ref TEXT NOT NULL,
                 embedding_ready BOOLEAN DEFAULT 0,
                 context_type TEXT,
+                segment_start REAL,
+                segment_end REAL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 UNIQUE(context_id)
@@ -213,6 +224,40 @@ class SQLiteBackend(IDocumentStorageBackend):
                 ADD COLUMN context_type TEXT
                 '''
             )
+        if 'segment_start' not in columns:
+            cursor.execute(
+                '''
+                ALTER TABLE glass_multimodal_context
+                ADD COLUMN segment_start REAL
+                '''
+            )
+        if 'segment_end' not in columns:
+            cursor.execute(
+                '''
+                ALTER TABLE glass_multimodal_context
+                ADD COLUMN segment_end REAL
+                '''
+            )
+
+    def _create_glass_embedding_cache(self, cursor: sqlite3.Cursor) -> None:
+        """Content-addressed cache of frame embeddings so re-ingested frames skip the encoder."""
+        cursor.execute('PRAGMA table_info(glass_embedding_cache)')
+        columns = [column[1] for column in cursor.fetchall()]
+        if columns and 'model' not in columns:
+            # Entries from before vectors were keyed by model cannot be attributed; drop the cache.
+            cursor.execute('DROP TABLE glass_embedding_cache')
+        cursor.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS glass_embedding_cache (
+                content_digest TEXT NOT NULL,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                dim INTEGER NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (content_digest, model)
+            )
+            '''
+        )
 
     def _insert_default_vault_document(self):
         """Insert default Quick Start document"""
@@ -107,6 +107,11 @@ class IVectorStorageBackend(IStorageBackend):
     def get_processed_context(self, id : str, context_type : str) -> ProcessedContext:
         """Get specified context"""
         
+    def batch_get_processed_context(self, ids: List[str], context_type: str) -> List[ProcessedContext]:
+        """Get several contexts of one type; backends should override with a single lookup"""
+        contexts = (self.get_processed_context(id, context_type) for id in ids)
+        return [context for context in contexts if context]
+
     @abstractmethod
     def delete_processed_context(self, id : str, context_type : str) -> bool:
         """Delete specified context"""
@@ -185,6 +185,22 @@ class UnifiedStorage:
     def get_processed_context(self, id : str, context_type : str):
         return self._vector_backend.get_processed_context(id, context_type)
     
+    def batch_get_processed_context(self, ids: List[str], context_type: str) -> List[ProcessedContext]:
+        """Get several processed contexts of one type from the vector database"""
+        if not self._initialized:
+            logger.error("Unified storage system not initialized")
+            return []
+
+        if not self._vector_backend:
+            logger.error("Vector database backend not initialized")
+            return []
+
+        try:
+            return self._vector_backend.batch_get_processed_context(ids, context_type)
+        except Exception as e:
+            logger.exception(f"Failed to batch get {context_type} contexts: {e}")
+            return []
+
     def delete_processed_context(self, id : str, context_type : str):
         return self._vector_backend.delete_processed_context(id, context_type)
     